@@ -0,0 +1,117 @@
+# alphabets.py
+# Alphabets utilisables par César et Vigénère (par défaut : a-z / A-Z).
+#
+# Un alphabet est formé d'un ou plusieurs "groupes" de même longueur, par exemple minuscules et majuscules.
+# Une lettre décalée reste dans son groupe : avec un décalage de 3, 'a' → 'd' et 'A' → 'D'.
+# Les caractères qui ne sont dans aucun groupe (espaces, ponctuation...) sont recopiés tels quels.
+#
+# Les groupes peuvent être donnés en str ou en bytes : un octet correspond au caractère de même code
+# (Latin-1), ce qui permet des alphabets d'octets quelconques, comme alphabet_octets(0x20, 0x7f).
+# Un message binaire (bytes) ne peut être chiffré qu'avec un alphabet dont toutes les lettres sont des octets
+# (code < 256) : ALPHABET_FRANCAIS contient 'œ' et 'Ÿ', il ne s'utilise donc qu'avec du texte (str).
+
+
+class Alphabet:
+    """
+    Alphabet de chiffrement : Alphabet("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ").
+    Immuable et hachable : il sert de clé dans les caches de César et Vigénère.
+
+    """
+    __slots__ = ("groupes", "taille", "rangs", "octets_possible", "ascii", "numpy_possible", "_hachage")
+
+    def __init__(self, *groupes):
+        if not groupes:
+            raise ValueError("Un alphabet doit contenir au moins un groupe de lettres.")
+        groupes = tuple(g.decode('latin-1') if isinstance(g, (bytes, bytearray)) else str(g) for g in groupes)
+        taille = len(groupes[0])
+        if taille < 2 or any(len(groupe) != taille for groupe in groupes):
+            raise ValueError("Tous les groupes d'un alphabet doivent avoir la même longueur (au moins 2 lettres).")
+
+        rangs = {}                             # lettre → (numéro du groupe, rang dans le groupe)
+        for numero, groupe in enumerate(groupes):
+            for rang, lettre in enumerate(groupe):
+                if lettre in rangs:
+                    raise ValueError(f"Lettre en double dans l'alphabet : {lettre!r}")
+                rangs[lettre] = (numero, rang)
+
+        self.groupes = groupes
+        self.taille = taille
+        self.rangs = rangs
+        self.octets_possible = all(ord(lettre) < 256 for lettre in rangs)     # Utilisable sur des bytes ?
+        self.ascii = all(ord(lettre) < 128 for lettre in rangs)               # Lettres toutes d'un octet en UTF-8 ?
+        self.numpy_possible = all(ord(lettre) < 0x10000 for lettre in rangs)  # Tables NumPy assez petites ?
+        self._hachage = hash(groupes)
+
+    def __eq__(self, autre):
+        return isinstance(autre, Alphabet) and self.groupes == autre.groupes
+
+    def __hash__(self):
+        return self._hachage
+
+    def __repr__(self):
+        return f"Alphabet{self.groupes!r}"
+
+    def __reduce__(self):
+        # Copie (pickle, processus) reconstruite par __init__ : le hachage des str change d'un processus à l'autre
+        return Alphabet, self.groupes
+
+    def decalage(self, lettre):
+        """
+        Décalage associé à une lettre de clé : son rang dans son groupe ('c' et 'C' → 2).
+
+        """
+        if lettre not in self.rangs:
+            raise ValueError(f"La lettre de clé {lettre!r} n'appartient pas à l'alphabet.")
+        return self.rangs[lettre][1]
+
+    def correspondance(self, decalages):
+        """
+        Dictionnaire {lettre: lettre décalée}. `decalages` : un entier, ou un décalage par groupe.
+
+        """
+        if isinstance(decalages, int):
+            decalages = (decalages,) * len(self.groupes)
+        resultat = {}
+        for groupe, decalage in zip(self.groupes, decalages):
+            decalage %= self.taille
+            decale = groupe[decalage:] + groupe[:decalage]     # Pour 3 : "defgh...abc"
+            resultat.update(zip(groupe, decale))
+        return resultat
+
+    def table_octets(self, decalages):
+        """
+        Table de 256 octets pour bytes.translate (les non-lettres restent inchangées).
+
+        """
+        alphabet_valide(self, binaire=True)
+        table = bytearray(range(256))
+        for source, cible in self.correspondance(decalages).items():
+            table[ord(source)] = ord(cible)
+        return bytes(table)
+
+
+def alphabet_octets(debut=0, fin=256):
+    """
+    Alphabet formé de tous les octets de debut (inclus) à fin (exclu), par exemple 0x20-0x7f (ASCII imprimable).
+
+    """
+    return Alphabet(bytes(range(debut, fin)))
+
+
+ALPHABET_ASCII = Alphabet("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+ALPHABET_FRANCAIS = Alphabet("abcdefghijklmnopqrstuvwxyzàâæçéèêëîïôœùûüÿ",
+                             "ABCDEFGHIJKLMNOPQRSTUVWXYZÀÂÆÇÉÈÊËÎÏÔŒÙÛÜŸ")
+
+
+def alphabet_valide(alphabet=None, binaire=False):
+    """
+    Alphabet vérifié (ALPHABET_ASCII si None). binaire=True : ses lettres doivent toutes être des octets.
+
+    """
+    if alphabet is None:
+        return ALPHABET_ASCII
+    if not isinstance(alphabet, Alphabet):
+        raise TypeError("L'alphabet doit être un objet alphabets.Alphabet.")
+    if binaire and not alphabet.octets_possible:
+        raise ValueError("Cet alphabet contient des lettres qui ne sont pas des octets : chiffrez du texte (str).")
+    return alphabet
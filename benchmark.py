@@ -0,0 +1,392 @@
+# benchmark.py
+# Mesures de performance reproductibles pour tous les modules de chiffrement
+#
+# Utilisation :
+#   python benchmark.py lancer --sortie resultats.json                 (toutes les mesures)
+#   python benchmark.py lancer --taille-max 1M --filtre cesar           (seulement César, jusqu'à 1 Mo)
+#   python benchmark.py comparer resultats.json reference.json --seuil 10
+#       → signale (et sort avec le code 1) toute mesure plus lente de plus de 10 % que la référence
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import cesar
+import factorisation
+import pgcd_lot
+import registre
+from alphabets import ALPHABET_FRANCAIS
+import rsa
+import vigenere
+
+TAILLES = (16, 1024, 64 * 1024, 1 << 20, 16 << 20, 100 << 20)   # De 16 o à 100 Mo
+TAILLE_MAX_RSA = 64 * 1024          # RSA fait main : au-delà, une mesure prend plusieurs minutes
+TAILLE_MAX_OAEP = 190               # OAEP + SHA256 sur 2048 bits : ~190 octets au maximum
+TAILLES_CLE_RSA = (512, 1024, 2048)
+TAILLES_CLE_MULTI = (2048, 4096)    # RSA multi-premiers : comparé au RSA à deux premiers
+TAILLE_MESSAGE_MULTI = 4096         # Message déchiffré pour chaque nombre de premiers
+NOMBRES_CLES_PGCD = (100, 1000)     # Nombre de modules de 1024 bits analysés par PGCD en lot
+BITS_MODULES_ECM = (256, 512)       # Une courbe ECM (B1 = 11000) sur un module de cette taille
+TAILLES_CLE_OAEP = (2048, 3072)
+# Temps de démarrage à froid maximal (ms, interpréteur compris) : au-delà, la mesure est signalée
+BUDGETS_DEMARRAGE_MS = {
+    "demarrage.cesar": 50,
+    "demarrage.vigenere": 50,
+    "demarrage.main_cesar": 80,                 # main.py importe aussi argparse (~20 ms à lui seul)
+    "demarrage.main_vigenere": 80,
+}
+GRAINE = 2024                       # Graine fixe → mêmes données à chaque lancement
+DUREE_MIN = 0.2                     # Chaque mesure dure au moins 0,2 s...
+REPETITIONS_MIN = 3                 # ...et au moins 3 appels
+REPETITIONS_MAX = 1000
+
+
+# ====================== DONNÉES DE TEST ======================
+@functools.lru_cache(maxsize=1)                 # Les cas d'une même taille se suivent : un seul texte gardé
+def texte_test(taille):
+
+    # Texte pseudo-aléatoire (lettres, majuscules, espaces, ponctuation) de `taille` caractères ASCII
+
+    generateur = random.Random(GRAINE)
+    alphabet = "abcdefghijklmnopqrstuvwxyz" * 3 + "ABCDEFGHIJKLMNOPQRSTUVWXYZ" + "     .,!'"
+    motif = "".join(generateur.choice(alphabet) for _ in range(min(taille, 64 * 1024)))
+    return (motif * (taille // len(motif) + 1))[:taille] if motif else ""
+
+
+def charger_rsa_auto():
+
+    # Module "rsa cle auto.py", ou None si la bibliothèque cryptography n'est pas installée
+
+    try:
+        return registre.charger_rsa_auto()
+    except ImportError:
+        return None
+
+
+# ====================== MESURE ======================
+def mesurer(fonction, taille):
+
+    # Appelle `fonction` plusieurs fois et retourne le débit (Mo/s) et les percentiles de latence (ms)
+
+    latences = []
+    debut_total = time.perf_counter()
+    while (len(latences) < REPETITIONS_MIN
+           or (time.perf_counter() - debut_total < DUREE_MIN and len(latences) < REPETITIONS_MAX)):
+        debut = time.perf_counter()
+        fonction()
+        latences.append(time.perf_counter() - debut)
+
+    latences.sort()
+    def percentile(p):
+        return latences[min(len(latences) - 1, int(p / 100 * len(latences)))] * 1000
+
+    mediane = percentile(50) / 1000
+    return {
+        "taille": taille,
+        "repetitions": len(latences),
+        "debit_mo_s": (taille / (1 << 20)) / mediane if taille and mediane > 0 else None,
+        "latence_ms": {"min": latences[0] * 1000, "p50": percentile(50), "p90": percentile(90),
+                       "p99": percentile(99), "max": latences[-1] * 1000},
+    }
+
+
+# ====================== CAS DE MESURE ======================
+# Chaque cas est un triplet (nom, taille en octets, fonction à mesurer).
+# Les fonctions sont créées à la demande pour ne pas préparer 100 Mo de données inutilement.
+# La fonction peut aussi être un gestionnaire de contexte qui la fournit (_a_la_demande, fichiers...) :
+# sa préparation n'est alors faite que si le cas passe le filtre, et défaite juste après.
+
+@contextlib.contextmanager
+def _a_la_demande(preparer):
+
+    # Cas dont la préparation coûte (clés RSA, données chiffrées, gros texte) : `preparer()` construit
+    # la fonction à mesurer seulement si le cas passe le filtre de lancer()
+
+    yield preparer()
+
+
+@functools.lru_cache(maxsize=None)
+def _cles_rsa(bits, nombre_premiers=2):
+    # Paire de clés de rsa.py générée une fois, partagée par tous les cas qui la mesurent
+    return rsa.rsa_generer_cles_auto(bits, nombre_premiers=nombre_premiers)
+
+
+@functools.lru_cache(maxsize=None)
+def _cles_oaep(module):
+    return module.rsa_generer_cles()
+
+
+def cas_cesar(tailles):
+    for taille in tailles:
+        for nom, fonction in (("chiffrer", cesar.cesar_chiffrer), ("dechiffrer", cesar.cesar_dechiffrer)):
+            yield (f"cesar.{nom}/{taille}", taille,
+                   _a_la_demande(lambda f=fonction, t=taille: functools.partial(f, texte_test(t), 3)))
+
+
+def cas_vigenere(tailles):
+    for taille in tailles:
+        for nom, fonction, cle, alphabet in (("chiffrer", vigenere.vigenere_chiffrer, "LEMON", None),
+                                             ("dechiffrer", vigenere.vigenere_dechiffrer, "LEMON", None),
+                                             ("chiffrer_francais", vigenere.vigenere_chiffrer, "CITRON",
+                                              ALPHABET_FRANCAIS)):
+            yield (f"vigenere.{nom}/{taille}", taille,
+                   _a_la_demande(lambda f=fonction, t=taille, c=cle, a=alphabet: functools.partial(
+                       f, texte_test(t), c, a)))
+        if taille >= vigenere.SEUIL_PARALLELE_FICHIER:
+            # Fichier → fichier, en série puis sur tous les cœurs (mode parallèle de vigenere_fichier)
+            for nom, processus in (("serie", 1), ("parallele", os.cpu_count() or 1)):
+                yield f"vigenere.fichier_{nom}/{taille}", taille, _fichiers_vigenere(taille, processus)
+
+
+@contextlib.contextmanager
+def _fichiers_vigenere(taille, processus):
+
+    # Fichiers de test écrits seulement si le cas est mesuré, dans un dossier temporaire supprimé juste après
+
+    with tempfile.TemporaryDirectory() as dossier:
+        entree = os.path.join(dossier, "entree.txt")
+        sortie = os.path.join(dossier, "sortie.txt")
+        with open(entree, 'w', encoding='ascii') as fichier:
+            fichier.write(texte_test(taille))
+        yield lambda: vigenere.vigenere_fichier(entree, sortie, "LEMON", processus=processus)
+
+
+def cas_rsa(tailles):
+    def chiffrer(bits, taille):
+        texte, (cle_publique, _) = texte_test(taille), _cles_rsa(bits)
+        return lambda: rsa.rsa_chiffrer(texte, cle_publique)
+
+    def dechiffrer(bits, taille):
+        cle_publique, cle_privee = _cles_rsa(bits)
+        blocs = rsa.rsa_chiffrer(texte_test(taille), cle_publique)
+        return lambda: rsa.rsa_dechiffrer(blocs, cle_privee)
+
+    for bits in TAILLES_CLE_RSA:
+        yield f"rsa.generer_cles/{bits}", 0, lambda b=bits: rsa.rsa_generer_cles_auto(b)
+        for taille in tailles:
+            if taille > TAILLE_MAX_RSA:
+                continue
+            yield f"rsa.chiffrer/{bits}/{taille}", taille, _a_la_demande(lambda b=bits, t=taille: chiffrer(b, t))
+            yield (f"rsa.dechiffrer/{bits}/{taille}", taille,
+                   _a_la_demande(lambda b=bits, t=taille: dechiffrer(b, t)))
+
+
+def cas_rsa_multi(tailles):
+    # Même module, même message : seul le nombre de premiers de la clé privée change (2, 3 puis 4)
+    def dechiffrer(bits, nombre_premiers):
+        cle_publique, cle_privee = _cles_rsa(bits, nombre_premiers)
+        blocs = rsa.rsa_chiffrer(texte_test(TAILLE_MESSAGE_MULTI), cle_publique)
+        return lambda: rsa.rsa_dechiffrer(blocs, cle_privee)
+
+    for bits in TAILLES_CLE_MULTI:
+        for nombre_premiers in range(2, rsa.MAX_PREMIERS + 1):
+            yield (f"rsa_multi.dechiffrer/{bits}/{nombre_premiers}p", TAILLE_MESSAGE_MULTI,
+                   _a_la_demande(lambda b=bits, p=nombre_premiers: dechiffrer(b, p)))
+
+
+def cas_pgcd_lot(tailles):
+    # Le coût ne dépend que du nombre et de la taille des modules : des entiers impairs aléatoires suffisent
+    def modules(nombre):
+        generateur = random.Random(GRAINE + nombre)
+        liste = [generateur.getrandbits(1024) | (1 << 1023) | 1 for _ in range(nombre)]
+        return lambda: pgcd_lot.pgcd_lot(liste)
+
+    for nombre in NOMBRES_CLES_PGCD:
+        yield f"pgcd_lot/{nombre}x1024", 0, _a_la_demande(lambda n=nombre: modules(n))
+
+
+def cas_factorisation(tailles):
+    # Paramètres fixes (c de rho, sigma d'ECM) : chaque mesure refait exactement le même calcul
+    def premier(generateur, bits):
+        while True:
+            candidat = generateur.getrandbits(bits) | (1 << (bits - 1)) | 1
+            if rsa.est_probablement_premier(candidat):
+                return candidat
+
+    def rho():
+        generateur = random.Random(GRAINE)
+        n = premier(generateur, 28) * premier(generateur, 28)
+        return lambda: factorisation.pollard_brent(n)
+
+    def ecm(bits):
+        generateur = random.Random(GRAINE + bits)
+        module = premier(generateur, bits // 2) * premier(generateur, bits // 2)
+        return lambda: factorisation.ecm_courbe(module, 12345, 11000)
+
+    yield "factorisation.rho/56", 0, _a_la_demande(rho)
+    for bits in BITS_MODULES_ECM:
+        yield f"factorisation.ecm_courbe/{bits}", 0, _a_la_demande(lambda b=bits: ecm(b))
+
+
+def cas_rsa_auto(tailles):
+    module = charger_rsa_auto()
+    if module is None:
+        print("cryptography absent : mesures de 'rsa cle auto.py' ignorées.", file=sys.stderr)
+        return
+
+    def preparer(chiffrer, dechiffrer, taille, sens):
+        cle_privee, cle_publique = _cles_oaep(module)
+        donnees = texte_test(taille).encode('ascii')
+        if sens == "chiffrer":
+            return lambda: chiffrer(donnees, cle_publique)
+        chiffre = chiffrer(donnees, cle_publique)
+        return lambda: dechiffrer(chiffre, cle_privee)
+
+    for bits in TAILLES_CLE_OAEP:
+        yield f"rsa_auto.generer_cles/{bits}", 0, lambda b=bits: module.rsa_generer_cles(b)
+    for taille in tailles:
+        modes = [("hybride", module.rsa_chiffrer_hybride, module.rsa_dechiffrer_hybride)]
+        if taille <= TAILLE_MAX_OAEP:
+            modes.insert(0, ("oaep", module.rsa_chiffrer, module.rsa_dechiffrer))
+        for mode, chiffrer, dechiffrer in modes:
+            for sens in ("chiffrer", "dechiffrer"):
+                yield (f"rsa_auto.{mode}_{sens}/{taille}", taille,
+                       _a_la_demande(lambda c=chiffrer, d=dechiffrer, t=taille, s=sens: preparer(c, d, t, s)))
+
+
+def cas_demarrage(tailles):
+
+    # Démarrage à froid : un nouvel interpréteur Python qui charge un seul algorithme via le registre,
+    # puis le programme principal en mode commande. Mesure le coût des imports.
+
+    dossier = os.path.dirname(os.path.abspath(__file__))
+    for nom in registre.noms():
+        code = f"import registre; registre.obtenir({nom!r}).module"
+        yield (f"demarrage.{nom}", 0,
+               lambda c=code: subprocess.run([sys.executable, "-c", c], cwd=dossier, check=True))
+    for nom, cle in (("cesar", "3"), ("vigenere", "LEMON")):
+        commande = [sys.executable, "main.py", nom, "-c", "--cle", cle]
+        yield (f"demarrage.main_{nom}", 0,
+               lambda c=commande: subprocess.run(c, cwd=dossier, input=b"Bonjour", capture_output=True, check=True))
+
+
+GROUPES = {
+    "demarrage": cas_demarrage,
+    "cesar": cas_cesar,
+    "vigenere": cas_vigenere,
+    "rsa": cas_rsa,
+    "rsa_multi": cas_rsa_multi,
+    "pgcd_lot": cas_pgcd_lot,
+    "factorisation": cas_factorisation,
+    "rsa_auto": cas_rsa_auto,
+}
+
+
+# ====================== LANCEMENT ======================
+def lancer(groupes, tailles, filtre=None):
+
+    # Exécute toutes les mesures des groupes choisis et retourne le dictionnaire de résultats
+
+    resultats = {}
+    for nom_groupe in groupes:
+        for nom, taille, fonction in GROUPES[nom_groupe](tailles):
+            if filtre and filtre not in nom:
+                continue
+            if hasattr(fonction, "__enter__"):
+                with fonction as preparee:           # Cas avec préparation (fichiers...) : faite ici seulement
+                    mesure = mesurer(preparee, taille)
+            else:
+                mesure = mesurer(fonction, taille)
+            resultats[nom] = mesure
+            debit = f"{mesure['debit_mo_s']:10.2f} Mo/s" if mesure["debit_mo_s"] else " " * 15
+            marque = ""
+            if nom in BUDGETS_DEMARRAGE_MS:
+                mesure["budget_ms"] = BUDGETS_DEMARRAGE_MS[nom]
+                if mesure["latence_ms"]["p50"] > mesure["budget_ms"]:
+                    marque = f"   HORS BUDGET (> {mesure['budget_ms']} ms)"
+            print(f"{nom:45s} {debit}   p50 {mesure['latence_ms']['p50']:10.3f} ms"
+                  f"   p99 {mesure['latence_ms']['p99']:10.3f} ms{marque}", flush=True)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "plateforme": platform.platform(),
+            "processeurs": os.cpu_count(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "graine": GRAINE,
+        },
+        "resultats": resultats,
+    }
+
+
+def comparer(actuel, reference, seuil):
+
+    # Compare la latence médiane de chaque mesure présente dans les deux fichiers.
+    # Retourne la liste des régressions : (nom, ancienne p50, nouvelle p50, écart en %)
+
+    regressions = []
+    for nom, mesure in sorted(actuel["resultats"].items()):
+        if nom not in reference["resultats"]:
+            continue
+        avant = reference["resultats"][nom]["latence_ms"]["p50"]
+        apres = mesure["latence_ms"]["p50"]
+        ecart = (apres - avant) / avant * 100 if avant > 0 else 0.0
+        marque = "RÉGRESSION" if ecart > seuil else ""
+        print(f"{nom:45s} {avant:10.3f} ms → {apres:10.3f} ms  {ecart:+7.1f} %  {marque}")
+        if ecart > seuil:
+            regressions.append((nom, avant, apres, ecart))
+    # Le budget de démarrage est absolu : il compte même sans mesure de référence
+    for nom, mesure in sorted(actuel["resultats"].items()):
+        budget = mesure.get("budget_ms")
+        if budget is not None and mesure["latence_ms"]["p50"] > budget:
+            print(f"{nom:45s} {mesure['latence_ms']['p50']:10.3f} ms > budget de {budget} ms  HORS BUDGET")
+            regressions.append((nom, budget, mesure["latence_ms"]["p50"], None))
+    return regressions
+
+
+def lire_taille(texte):
+
+    # "64K" → 65536, "1M" → 1048576, "100" → 100
+
+    multiplicateurs = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    texte = texte.strip().upper()
+    if texte and texte[-1] in multiplicateurs:
+        return int(texte[:-1]) * multiplicateurs[texte[-1]]
+    return int(texte)
+
+
+def main(arguments=None):
+    analyseur = argparse.ArgumentParser(description="Mesures de performance des modules de chiffrement.")
+    sous_commandes = analyseur.add_subparsers(dest="commande", required=True)
+
+    p_lancer = sous_commandes.add_parser("lancer", help="Exécuter les mesures")
+    p_lancer.add_argument("--sortie", default="bench_output.json", help="Fichier JSON des résultats")
+    p_lancer.add_argument("--groupes", nargs="+", choices=sorted(GROUPES), default=list(GROUPES))
+    p_lancer.add_argument("--filtre", help="Ne garder que les mesures dont le nom contient ce texte")
+    p_lancer.add_argument("--taille-max", default="100M", help="Taille maximale des messages (ex : 1M)")
+
+    p_comparer = sous_commandes.add_parser("comparer", help="Comparer deux fichiers de résultats")
+    p_comparer.add_argument("actuel")
+    p_comparer.add_argument("reference")
+    p_comparer.add_argument("--seuil", type=float, default=10.0,
+                            help="Ralentissement toléré en %% avant de signaler une régression")
+
+    args = analyseur.parse_args(arguments)
+
+    if args.commande == "lancer":
+        taille_max = lire_taille(args.taille_max)
+        tailles = [t for t in TAILLES if t <= taille_max]
+        resultats = lancer(args.groupes, tailles, args.filtre)
+        with open(args.sortie, "w", encoding="utf-8") as fichier:
+            json.dump(resultats, fichier, indent=2, ensure_ascii=False)
+        print(f"\nRésultats enregistrés dans {args.sortie}")
+        return 0
+
+    with open(args.actuel, encoding="utf-8") as fichier:
+        actuel = json.load(fichier)
+    with open(args.reference, encoding="utf-8") as fichier:
+        reference = json.load(fichier)
+    regressions = comparer(actuel, reference, args.seuil)
+    print(f"\n{len(regressions)} régression(s) au-delà de {args.seuil} %")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,111 @@
 # cesar.py
-def cesar_chiffrer(message, cle):
+import functools
+
+from alphabets import alphabet_valide
+
+# ====================== TABLES DE DÉCALAGE PRÉCALCULÉES ======================
+# On calcule UNE SEULE FOIS les 26 tables de substitution possibles (une par décalage).
+# Ensuite chaque chiffrement se résume à un seul appel à .translate(), fait en C :
+# plus de concaténation caractère par caractère (coût quadratique) ni d'ord()/chr().
+
+_MINUSCULES = "abcdefghijklmnopqrstuvwxyz"
+_MAJUSCULES = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _construire_tables():
+    """
+    Construit les 26 tables de décalage, pour les str et pour les bytes.
+    
+    """
+    tables_str = []                              # Tables pour str.translate (dictionnaires)
+    tables_bytes = []                            # Tables pour bytes.translate (256 octets)
+    for decalage in range(26):
+        # Alphabet décalé : pour 3 → "defghijklmnopqrstuvwxyzabc"
+        minuscules = _MINUSCULES[decalage:] + _MINUSCULES[:decalage]
+        majuscules = _MAJUSCULES[decalage:] + _MAJUSCULES[:decalage]
+        source = _MINUSCULES + _MAJUSCULES
+        cible = minuscules + majuscules
+        tables_str.append(str.maketrans(source, cible))
+        tables_bytes.append(bytes.maketrans(source.encode('ascii'), cible.encode('ascii')))
+    return tuple(tables_str), tuple(tables_bytes)
+
+
+_TABLES_STR, _TABLES_BYTES = _construire_tables()
+
+TAILLE_CACHE_ALPHABETS = 32                      # Nombre d'alphabets personnalisés gardés en cache
+
+
+class _TablesParesseuses:
+    """
+    Tables d'un alphabet personnalisé, construites à la première utilisation de chaque décalage
+    (un alphabet de 256 octets a 256 décalages possibles : inutile de tous les préparer).
+    
+    """
+
+    def __init__(self, alphabet, binaire):
+        self._alphabet = alphabet
+        self._binaire = binaire
+        self._tables = [None] * alphabet.taille
+
+    def __getitem__(self, decalage):
+        table = self._tables[decalage]
+        if table is None:
+            if self._binaire:
+                table = self._alphabet.table_octets(decalage)
+            else:
+                table = str.maketrans(self._alphabet.correspondance(decalage))
+            self._tables[decalage] = table
+        return table
+
+
+@functools.lru_cache(maxsize=TAILLE_CACHE_ALPHABETS)
+def _tables_alphabet(alphabet):
+    """
+    Tables (str, bytes) d'un alphabet personnalisé, gardées en cache.
+    
+    """
+    alphabet_valide(alphabet)
+    return _TablesParesseuses(alphabet, False), _TablesParesseuses(alphabet, True)
+
+
+def _appliquer_table(message, decalage, tables_str=_TABLES_STR, tables_bytes=_TABLES_BYTES):
+    """
+    Applique la table du décalage au message en une seule passe.
+    Accepte str, bytes, bytearray et memoryview (le type de sortie suit l'entrée,
+    une memoryview donne des bytes).
+    
+    """
+    if isinstance(message, str):                 # Texte → table str
+        return message.translate(tables_str[decalage])
+    if isinstance(message, (bytes, bytearray)):  # Binaire → table de 256 octets
+        return message.translate(tables_bytes[decalage])
+    if isinstance(message, memoryview):          # Vue mémoire → on copie une fois en bytes
+        return message.tobytes().translate(tables_bytes[decalage])
+    raise TypeError("Le message doit être de type str, bytes, bytearray ou memoryview.")
+
+
+def cesar_chiffrer(message, cle, alphabet=None):
     """
     Chiffre un message en utilisant l'algorithme de César.
+    alphabet : alphabets.Alphabet personnalisé (par défaut a-z / A-Z).
     
     """
-    resultat = ""                                # Chaîne vide qui va contenir le texte chiffré
-    for char in message:                         # On parcourt chaque caractère du message
-        if 'a' <= char <= 'z':                   # Si c'est une lettre minuscule
-            # On convertit la lettre en position (0 à 25), on ajoute la clé,
-            # on fait % 26 pour boucler dans l'alphabet, puis on revient à la lettre
-            resultat += chr(((ord(char) - ord('a') + cle) % 26) + ord('a'))
-        elif 'A' <= char <= 'Z':                 # Si c'est une lettre majuscule
-            # Même principe, mais pour les majuscules
-            resultat += chr(((ord(char) - ord('A') + cle) % 26) + ord('A'))
-        else:
-            # Si c'est un espace, un chiffre, un signe de ponctuation → on le laisse intact
-            resultat += char
-    return resultat                              # On retourne le message final chiffré
+    # Seules les lettres a-z / A-Z sont décalées ; espaces, chiffres, accents → intacts.
+    # % 26 ramène n'importe quelle clé (même négative) entre 0 et 25.
+    if alphabet is None:
+        return _appliquer_table(message, cle % 26)
+    return _appliquer_table(message, cle % alphabet.taille, *_tables_alphabet(alphabet))
 
 
-def cesar_dechiffrer(message, cle):
+def cesar_dechiffrer(message, cle, alphabet=None):
     """
     Déchiffre un message chiffré avec l'algorithme de César.
     
     """
-    # Exemple : clé 3 → pour revenir en arrière, on décale de -3 (ou +23)
-    return cesar_chiffrer(message, -cle)
+    # Exemple : clé 3 → pour revenir en arrière, on utilise la table inverse (décalage de +23)
+    if alphabet is None:
+        return _appliquer_table(message, (-cle) % 26)
+    return _appliquer_table(message, (-cle) % alphabet.taille, *_tables_alphabet(alphabet))
 
 #****************** Tester *********************#
 
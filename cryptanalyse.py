@@ -0,0 +1,213 @@
+# cryptanalyse.py
+# Module de cryptanalyse : retrouver la clé d'un message chiffré avec Vigénère
+# (méthode de Kasiski + indice de coïncidence + test du khi-deux sur les fréquences des lettres)
+
+
+# ====================== FRÉQUENCES DES LETTRES (en %) ======================
+FREQUENCES = {
+    'fr': (7.64, 0.90, 3.26, 3.67, 14.72, 1.07, 0.87, 0.74, 7.53, 0.61, 0.07, 5.46, 2.97,
+           7.10, 5.80, 2.52, 1.36, 6.69, 7.95, 7.24, 6.31, 1.84, 0.05, 0.43, 0.13, 0.33),
+    'en': (8.17, 1.49, 2.78, 4.25, 12.70, 2.23, 2.02, 6.09, 6.97, 0.15, 0.77, 4.03, 2.41,
+           6.75, 7.51, 1.93, 0.10, 5.99, 6.33, 9.06, 2.76, 0.98, 2.36, 0.15, 1.97, 0.07),
+}
+
+_MAJUSCULES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# Tous les octets qui ne sont PAS des lettres majuscules → à supprimer
+_NON_LETTRES = bytes(o for o in range(256) if o not in _MAJUSCULES)
+
+ECHANTILLON_KASISKI = 20000        # Lettres utilisées pour chercher les répétitions (suffisant statistiquement)
+ECHANTILLON_IC = 200000            # Lettres utilisées pour estimer la longueur de clé par l'indice de coïncidence
+
+
+# ====================== OUTILS ======================
+def _lettres(texte_chiffre):
+    """
+    Ne garde que les lettres du message, en majuscules, sous forme de bytes (A-Z uniquement).
+
+    """
+    if isinstance(texte_chiffre, str):
+        texte_chiffre = texte_chiffre.encode('utf-8')   # Les octets non ASCII ne sont jamais des lettres
+    # upper() et translate(..., delete) sont faits en C : une seule passe sur tout le texte
+    return bytes(texte_chiffre).upper().translate(None, _NON_LETTRES)
+
+
+def _compter(lettres):
+    """
+    Histogramme des 26 lettres (liste de 26 entiers).
+
+    """
+    return [lettres.count(lettre) for lettre in _MAJUSCULES]
+
+
+def indice_coincidence(comptes):
+    """
+    Probabilité que deux lettres tirées au hasard soient identiques.
+    ≈ 0.038 pour un texte aléatoire, ≈ 0.066 (anglais) à 0.078 (français) pour un texte clair.
+
+    """
+    total = sum(comptes)
+    if total < 2:
+        return 0.0
+    return sum(c * (c - 1) for c in comptes) / (total * (total - 1))
+
+
+def khi_deux(comptes, decalage, frequences):
+    """
+    Écart entre l'histogramme décalé de `decalage` et les fréquences attendues (plus petit = plus probable).
+
+    """
+    total = sum(comptes)
+    if total == 0:
+        return 0.0
+    score = 0.0
+    for i in range(26):
+        attendu = total * frequences[i] / 100
+        ecart = comptes[(i + decalage) % 26] - attendu
+        score += ecart * ecart / attendu
+    return score
+
+
+# ====================== LONGUEUR DE LA CLÉ ======================
+def kasiski(lettres, longueur_max=20):
+    """
+    Méthode de Kasiski : pour chaque longueur L, proportion des distances entre trigrammes répétés divisibles par L.
+
+    """
+    lettres = lettres[:ECHANTILLON_KASISKI]
+    dernieres_positions = {}
+    distances = []
+    for i in range(len(lettres) - 2):
+        trigramme = lettres[i:i + 3]
+        if trigramme in dernieres_positions:
+            distances.append(i - dernieres_positions[trigramme])
+        dernieres_positions[trigramme] = i
+
+    scores = {}
+    for longueur in range(1, longueur_max + 1):
+        if distances:
+            scores[longueur] = sum(1 for d in distances if d % longueur == 0) / len(distances)
+        else:
+            scores[longueur] = 0.0
+    return scores
+
+
+def estimer_longueur_cle(texte_chiffre, longueur_max=20):
+    """
+    Estime la longueur de la clé Vigénère.
+    Retourne la liste des candidats [(longueur, score), ...] du plus probable au moins probable.
+
+    """
+    lettres = _lettres(texte_chiffre)
+    echantillon = lettres[:ECHANTILLON_IC]
+    longueur_max = max(1, min(longueur_max, len(echantillon) // 2))
+
+    # Indice de coïncidence moyen des colonnes pour chaque longueur possible
+    ic = {}
+    for longueur in range(1, longueur_max + 1):
+        colonnes = [echantillon[k::longueur] for k in range(longueur)]
+        ic[longueur] = sum(indice_coincidence(_compter(c)) for c in colonnes) / longueur
+
+    meilleur_ic = max(ic.values()) or 1.0
+    scores_kasiski = kasiski(lettres, longueur_max)
+
+    # L'IC favorise les multiples de la vraie longueur, Kasiski favorise ses diviseurs :
+    # le produit des deux est maximal sur la vraie longueur.
+    if any(scores_kasiski[l] > 0 for l in range(2, longueur_max + 1)):
+        scores = {l: (ic[l] / meilleur_ic) * scores_kasiski[l] for l in ic}
+    else:
+        # Pas de répétitions exploitables → on garde la plus petite longueur proche du meilleur IC
+        scores = {l: (ic[l] / meilleur_ic) - 0.001 * l for l in ic}
+
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+# ====================== RÉCUPÉRATION DE LA CLÉ ======================
+def _meilleur_decalage(comptes, frequences):
+    """
+    Décalage (0-25) qui minimise le khi-deux, avec son score.
+
+    """
+    return min(((khi_deux(comptes, d, frequences), d) for d in range(26)))
+
+
+def vigenere_casser(texte_chiffre, longueur_cle=None, langue=None, longueur_max=20):
+    """
+    Retrouve la clé d'un message chiffré avec vigenere.vigenere_chiffrer.
+    Paramètres :
+        longueur_cle : longueur connue de la clé (sinon elle est estimée)
+        langue       : 'fr', 'en' ou None (on essaie les deux et on garde la meilleure)
+    Retourne : (clé en majuscules, langue retenue)
+
+    """
+    lettres = _lettres(texte_chiffre)
+    if not lettres:
+        raise ValueError("Le message ne contient aucune lettre.")
+    if longueur_cle is None:
+        longueur_cle = estimer_longueur_cle(lettres, longueur_max)[0][0]
+
+    # Un seul histogramme par colonne : on ne déchiffre jamais le texte pour tester une lettre de clé
+    comptes_colonnes = [_compter(lettres[k::longueur_cle]) for k in range(longueur_cle)]
+
+    langues = [langue] if langue else list(FREQUENCES)
+    meilleur = None
+    for nom in langues:
+        resultats = [_meilleur_decalage(comptes, FREQUENCES[nom]) for comptes in comptes_colonnes]
+        score_total = sum(score for score, _ in resultats)
+        cle = "".join(chr(ord('A') + decalage) for _, decalage in resultats)
+        if meilleur is None or score_total < meilleur[0]:
+            meilleur = (score_total, cle, nom)
+
+    cle = meilleur[1]
+    # Si la clé trouvée est une répétition ("ABCABC"), on garde le motif le plus court ("ABC")
+    for periode in range(1, len(cle)):
+        if len(cle) % periode == 0 and cle[:periode] * (len(cle) // periode) == cle:
+            cle = cle[:periode]
+            break
+    return cle, meilleur[2]
+
+
+# ====================== CÉSAR : CLASSEMENT DES 26 CLÉS ======================
+def cesar_casser(texte_chiffre, k=3, langue=None):
+    """
+    Classe les 26 clés César possibles pour un message chiffré avec cesar.cesar_chiffrer.
+    Un seul histogramme du texte chiffré est calculé, puis "tourné" 26 fois :
+    le texte n'est jamais déchiffré pour tester une clé.
+    Retourne les k meilleures clés : [(clé, score khi-deux), ...] (score plus petit = plus probable).
+
+    """
+    comptes = _compter(_lettres(texte_chiffre))
+    langues = [langue] if langue else list(FREQUENCES)
+    # Pour chaque décalage, on garde le meilleur score parmi les langues testées
+    scores = [(min(khi_deux(comptes, cle, FREQUENCES[nom]) for nom in langues), cle) for cle in range(26)]
+    scores.sort()
+    return [(cle, score) for score, cle in scores[:k]]
+
+
+def cesar_casser_lot(textes_chiffres, k=1, langue=None):
+    """
+    Casse un grand nombre de messages César courts (liste, générateur, fichier ouvert lu ligne par ligne...).
+    Générateur : chaque résultat (indice, [(clé, score), ...]) est renvoyé dès qu'il est prêt.
+
+    """
+    for indice, texte_chiffre in enumerate(textes_chiffres):
+        yield indice, cesar_casser(texte_chiffre, k, langue)
+
+
+#****************** Tester *********************#
+
+if __name__ == "__main__":
+    from vigenere import vigenere_chiffrer, vigenere_dechiffrer
+
+    texte_clair = ("La cryptographie est une des disciplines de la cryptologie s'attachant a proteger "
+                   "des messages en s'aidant souvent de secrets ou cles. ") * 20
+    cle_vigenere = "SECRET"
+    texte_chiffre = vigenere_chiffrer(texte_clair, cle_vigenere)
+
+    cle_trouvee, langue = vigenere_casser(texte_chiffre)
+    print(f"Clé réelle : {cle_vigenere}")
+    print(f"Clé trouvée : {cle_trouvee} (langue : {langue})")
+    print("Succès !" if vigenere_dechiffrer(texte_chiffre, cle_trouvee) == texte_clair else "Échec")
+
+    from cesar import cesar_chiffrer
+    texte_chiffre_cesar = cesar_chiffrer("Attaque demain matin au lever du soleil", 7)
+    print(f"César, meilleures clés : {cesar_casser(texte_chiffre_cesar)}")
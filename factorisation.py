@@ -0,0 +1,518 @@
+# factorisation.py
+# Factorisation d'entiers pour auditer les clés RSA de rsa.py : combien de temps pour casser une clé (e, n) ?
+#   1. division par les petits premiers (rsa.crible) ;
+#   2. rho de Pollard, avec la détection de cycle de Brent et des pgcd groupés (un pgcd pour LOT_PGCD pas) ;
+#   3. ECM de Lenstra (courbes de Montgomery, étapes 1 et 2) pour les facteurs de taille moyenne.
+# Les tentatives (rho et plusieurs courbes ECM) tournent en parallèle sur plusieurs processus,
+# avec un budget de temps par clé : la première qui trouve un facteur arrête les autres.
+#
+# Utilisation :
+#   python factorisation.py factoriser 8051
+#   python factorisation.py audit cles.txt --budget 10 --processus 4        (même format que pgcd_lot.py)
+#   python factorisation.py mesurer --bits 32 48 64 80 --cles 3 --budget 60 (temps pour casser par taille)
+
+import argparse
+import functools
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from rsa import MAX_PREMIERS, crible, est_probablement_premier, mod_inverse, rsa_cles_depuis_premiers
+
+LIMITE_DIVISION_ESSAI = 1 << 16
+PREMIERS_DIVISION = crible(LIMITE_DIVISION_ESSAI)   # 6542 premiers
+LOT_PGCD = 128                                      # Rho : un pgcd tous les LOT_PGCD pas au lieu d'un par pas
+ITERATIONS_RHO_RAPIDE = 1 << 14                     # Rho "express" avant de lancer les grands moyens
+ITERATIONS_RHO_SERIE = 1 << 18                      # Sur un seul cœur, rho passe ensuite la main à ECM
+# ECM : (B1, nombre de courbes) par palier, pour des facteurs d'environ 15, 20, 25, 30 et 35 chiffres
+PALIERS_ECM = ((2000, 25), (11000, 90), (50000, 300), (250000, 700), (1000000, 1800))
+RAPPORT_B2 = 100                                    # Borne de l'étape 2 : B2 = 100 × B1
+PAS_GEANT = 210                                     # 2 × 3 × 5 × 7 : pas de l'étape 2 d'ECM
+
+
+# ====================== INTERRUPTION (budget de temps, arrêt demandé) ======================
+class _Interrompu(Exception):
+    pass
+
+
+class _Controle:
+
+    # Échéance (time.monotonic) et événement d'arrêt partagé entre processus : verifier() lève _Interrompu
+
+    __slots__ = ("echeance", "arret")
+
+    def __init__(self, duree=None, arret=None):
+        self.echeance = None if duree is None else time.monotonic() + duree
+        self.arret = arret
+
+    def verifier(self):
+        if self.echeance is not None and time.monotonic() > self.echeance:
+            raise _Interrompu
+        if self.arret is not None and self.arret.is_set():
+            raise _Interrompu
+
+
+_SANS_LIMITE = _Controle()
+
+
+# ====================== DIVISION PAR LES PETITS PREMIERS ======================
+def division_essai(n):
+    """
+    Retire de n tous ses facteurs premiers < LIMITE_DIVISION_ESSAI.
+    Retourne (liste des petits facteurs premiers, reste).
+
+    """
+    facteurs = []
+    for p in PREMIERS_DIVISION:
+        if p * p > n:
+            break
+        while n % p == 0:
+            facteurs.append(p)
+            n //= p
+    if 1 < n < LIMITE_DIVISION_ESSAI * LIMITE_DIVISION_ESSAI and all(n % p for p in PREMIERS_DIVISION):
+        facteurs.append(n)                          # Plus aucun diviseur <= racine de n : n est premier
+        n = 1
+    return facteurs, n
+
+
+# ====================== RHO DE POLLARD (variante de Brent) ======================
+def pollard_brent(n, c=1, x0=2, controle=_SANS_LIMITE, iterations_max=None):
+    """
+    Cherche un facteur de n avec la suite x → x² + c mod n (cycle détecté par la méthode de Brent).
+    Les |x - y| sont multipliés entre eux et on ne calcule qu'un pgcd tous les LOT_PGCD pas.
+    Retourne un facteur non trivial, ou None (échec avec ce c, ou iterations_max atteint).
+
+    """
+    if n % 2 == 0:
+        return 2
+    y, r, q, g = x0 % n, 1, 1, 1
+    x = ys = y
+    iterations = 0
+    while g == 1:
+        x = y
+        for debut in range(0, r, LOT_PGCD):         # On avance de r pas (sans pgcd)
+            for _ in range(min(LOT_PGCD, r - debut)):
+                y = (y * y + c) % n
+            controle.verifier()
+        k = 0
+        while k < r and g == 1:
+            ys = y                                  # Point de reprise si le lot "saute" le facteur
+            for _ in range(min(LOT_PGCD, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += LOT_PGCD
+            controle.verifier()
+        iterations += 2 * r
+        if g == 1 and iterations_max is not None and iterations >= iterations_max:
+            return None
+        r *= 2
+    if g == n:
+        # Le produit du lot contient tous les facteurs : on refait le lot pas à pas depuis ys
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+    return g if g != n else None
+
+
+# ====================== ECM (courbes elliptiques de Montgomery) ======================
+# Points en coordonnées (X : Z) : on ne calcule jamais d'inverse modulaire pendant les multiplications.
+# Si p divise n et que l'ordre de la courbe modulo p n'a que de petits facteurs, Z devient ≡ 0 (mod p) :
+# pgcd(Z, n) révèle p.
+
+def _doubler(x, z, n, a24):
+    somme = (x + z) * (x + z) % n
+    difference = (x - z) * (x - z) % n
+    t = somme - difference
+    return somme * difference % n, t * (difference + a24 * t) % n
+
+
+def _additionner(xp, zp, xq, zq, x_diff, z_diff, n):
+    # P + Q, connaissant P - Q
+    u = (xp - zp) * (xq + zq)
+    v = (xp + zp) * (xq - zq)
+    return z_diff * (u + v) * (u + v) % n, x_diff * (u - v) * (u - v) % n
+
+
+def _multiplier(k, x, z, n, a24, controle=_SANS_LIMITE):
+    # Échelle de Montgomery : (R0, R1) = (jP, (j + 1)P) à chaque étape, donc R1 - R0 = P est connu
+    x0, z0 = x, z
+    x1, z1 = _doubler(x, z, n, a24)
+    for i, bit in enumerate(bin(k)[3:]):
+        if bit == '1':
+            x0, z0 = _additionner(x1, z1, x0, z0, x, z, n)
+            x1, z1 = _doubler(x1, z1, n, a24)
+        else:
+            x1, z1 = _additionner(x1, z1, x0, z0, x, z, n)
+            x0, z0 = _doubler(x0, z0, n, a24)
+        if i & 1023 == 0:
+            controle.verifier()
+    return x0, z0
+
+
+@functools.lru_cache(maxsize=8)
+def _multiplicateur_etape1(b1):
+    # Produit de toutes les puissances de premiers <= B1 (p^e <= B1 < p^(e+1))
+    k = 1
+    for p in crible(b1):
+        puissance = p
+        while puissance * p <= b1:
+            puissance *= p
+        k *= puissance
+    return k
+
+
+@functools.lru_cache(maxsize=4)
+def _table_premiers(limite):
+    # Table de primalité (bytearray) : table[i] == 1 si i est premier
+    table = bytearray([1]) * (limite + 1)
+    table[0:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limite) + 1):
+        if table[i]:
+            table[i * i::i] = bytes(len(range(i * i, limite + 1, i)))
+    return table
+
+
+def ecm_courbe(n, sigma, b1, b2=None, controle=_SANS_LIMITE):
+    """
+    Une courbe ECM (paramétrage de Suyama, indice sigma) : étape 1 jusqu'à B1, étape 2 jusqu'à B2.
+    Retourne un facteur non trivial de n, ou None.
+
+    """
+    b2 = RAPPORT_B2 * b1 if b2 is None else b2
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    numerateur = pow(v - u, 3, n) * (3 * u + v) % n
+    denominateur = 16 * x * v % n
+    g = math.gcd(denominateur, n)
+    if g != 1:
+        return g if g != n else None                # Pas d'inverse : on a trouvé un facteur (par chance)
+    a24 = numerateur * pow(denominateur, -1, n) % n  # (A + 2) / 4
+
+    # Étape 1 : Q = k × P, avec k = produit des puissances de premiers <= B1
+    x, z = _multiplier(_multiplicateur_etape1(b1), x, z, n, a24, controle)
+    g = math.gcd(z, n)
+    if g != 1:
+        return g if g != n else None
+
+    # Étape 2 : un dernier premier q dans ]B1, B2] (pas de bébé / pas de géant).
+    # q = k × w ± b avec w = PAS_GEANT et b < w/2 premier avec w ; qQ = O (mod p) ⇔ x(kwQ) = x(bQ),
+    # ce qu'on teste sans division par X(kwQ) Z(bQ) - X(bQ) Z(kwQ), accumulé dans un produit.
+    w = PAS_GEANT
+    multiples = {1: (x, z), 2: _doubler(x, z, n, a24)}
+    for j in range(3, w // 2 + 1):
+        multiples[j] = _additionner(*multiples[j - 1], x, z, *multiples[j - 2], n)
+    bebes = [(b,) + multiples[b] for b in range(1, w // 2, 2) if math.gcd(b, w) == 1]
+    est_premier = _table_premiers(b2 + w)
+
+    xw, zw = _multiplier(w, x, z, n, a24)
+    k = max(2, b1 // w)
+    x_geant, z_geant = _multiplier(k * w, x, z, n, a24)
+    x_prec, z_prec = _multiplier((k - 1) * w, x, z, n, a24)
+    produit = 1
+    while k * w - w // 2 <= b2:
+        centre = k * w
+        for b, xb, zb in bebes:
+            if (b1 < centre - b <= b2 and est_premier[centre - b]) or (b1 < centre + b <= b2 and est_premier[centre + b]):
+                produit = produit * (x_geant * zb - xb * z_geant) % n
+        (x_geant, z_geant), (x_prec, z_prec) = (
+            _additionner(x_geant, z_geant, xw, zw, x_prec, z_prec, n), (x_geant, z_geant))
+        k += 1
+        if k & 63 == 0:
+            controle.verifier()
+    g = math.gcd(produit, n)
+    return g if 1 < g < n else None
+
+
+# ====================== TENTATIVES (dans un processus ou en série) ======================
+_arret_processus = None                             # Événement d'arrêt, transmis à chaque processus de travail
+
+
+def _initialiser_processus(arret):
+    global _arret_processus
+    _arret_processus = arret
+
+
+def _tentative(n, methode, graine, duree):
+    """
+    Cherche un facteur de n avec `methode` ("rho" ou "ecm") jusqu'au succès, à la fin de `duree` (secondes,
+    None = sans limite) ou à l'arrêt demandé par le processus principal. Retourne le facteur ou None.
+
+    """
+    controle = _Controle(duree, _arret_processus)
+    generateur = random.Random(graine)
+    try:
+        if methode == "rho":
+            while True:                             # Échec avec un c → on recommence avec un autre
+                facteur = pollard_brent(n, generateur.randrange(1, n - 1), generateur.randrange(n), controle)
+                if facteur:
+                    return facteur
+        for b1, courbes in PALIERS_ECM:
+            for _ in range(courbes):
+                facteur = ecm_courbe(n, generateur.randrange(6, n - 1), b1, controle=controle)
+                if facteur:
+                    return facteur
+        return None
+    except _Interrompu:
+        return None
+
+
+# ====================== MOTEUR DE FACTORISATION ======================
+class Factoriseur:
+    """
+    Factorise des entiers avec un budget de temps par entier, sur `processus` cœurs (None = tous).
+    Le pool de processus est créé une fois et réutilisé : à utiliser avec "with Factoriseur(4) as f: ...".
+
+    """
+
+    def __init__(self, processus=1):
+        self.processus = processus or os.cpu_count() or 1
+        self._executeur = None
+        self._arret = None
+        self._graines = random.Random()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    def fermer(self):
+        if self._executeur is not None:
+            self._executeur.shutdown(wait=True)
+            self._executeur = None
+
+    def _demarrer(self):
+        if self._executeur is None:
+            # Imports ici : inutiles tant qu'on reste sur un seul cœur
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._arret = multiprocessing.Event()
+            self._executeur = ProcessPoolExecutor(max_workers=self.processus, initializer=_initialiser_processus,
+                                                  initargs=(self._arret,))
+        return self._executeur
+
+    def trouver_facteur(self, n, duree=None):
+        """
+        Un facteur non trivial de n (composé, sans petit facteur), ou None si le budget `duree` est épuisé.
+
+        """
+        facteur = pollard_brent(n, iterations_max=ITERATIONS_RHO_RAPIDE)  # Petits facteurs : inutile de paralléliser
+        if facteur:
+            return facteur
+
+        if self.processus <= 1:
+            # Un seul cœur : un peu plus de rho (facteurs jusqu'à ~35 bits), puis ECM jusqu'à la fin du budget
+            debut = time.monotonic()
+            try:
+                facteur = pollard_brent(n, 3, 2, _Controle(duree), ITERATIONS_RHO_SERIE)
+            except _Interrompu:
+                return None
+            if facteur:
+                return facteur
+            return _tentative(n, "ecm", self._graines.random(),
+                              None if duree is None else duree - (time.monotonic() - debut))
+
+        # Plusieurs cœurs : un processus fait rho, tous les autres font des courbes ECM différentes
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        executeur = self._demarrer()
+        methodes = ["rho"] + ["ecm"] * (self.processus - 1)
+        en_cours = {executeur.submit(_tentative, n, methode, self._graines.random(), duree) for methode in methodes}
+        facteur = None
+        try:
+            while en_cours and facteur is None:
+                termines, en_cours = wait(en_cours, return_when=FIRST_COMPLETED)
+                facteur = next((f.result() for f in termines if f.result()), None)
+        finally:
+            self._arret.set()                       # Les tentatives encore en cours s'arrêtent...
+            wait(en_cours)
+            self._arret.clear()                     # ...puis le pool est prêt pour l'entier suivant
+        return facteur
+
+    def factoriser(self, n, budget=None):
+        """
+        Décompose n en facteurs premiers en au plus `budget` secondes (None = sans limite).
+        Retourne (facteurs premiers triés, parties composées non factorisées faute de temps).
+
+        """
+        echeance = None if budget is None else time.monotonic() + budget
+        premiers, reste = division_essai(n)
+        a_traiter = [reste] if reste > 1 else []
+        composes = []
+        while a_traiter:
+            m = a_traiter.pop()
+            if est_probablement_premier(m):
+                premiers.append(m)
+                continue
+            racine = math.isqrt(m)
+            if racine * racine == m:                # p = q : un carré parfait se voit tout de suite
+                a_traiter += [racine, racine]
+                continue
+            restant = None if echeance is None else echeance - time.monotonic()
+            facteur = None if restant is not None and restant <= 0 else self.trouver_facteur(m, restant)
+            if facteur is None:
+                composes.append(m)
+            else:
+                a_traiter += [facteur, m // facteur]
+        return sorted(premiers), sorted(composes)
+
+
+def factoriser(n, budget=None, processus=1):
+    """
+    Raccourci : Factoriseur(processus).factoriser(n, budget).
+
+    """
+    with Factoriseur(processus) as factoriseur:
+        return factoriseur.factoriser(n, budget)
+
+
+# ====================== AUDIT DE CLÉS RSA ======================
+def exposant_prive(e, premiers):
+    """
+    Retrouve d à partir de e et de la décomposition complète de n (φ(n) calculé, même si un premier se répète).
+
+    """
+    phi = 1
+    for p, puissance in Counter(premiers).items():
+        phi *= (p - 1) * p ** (puissance - 1)
+    if math.gcd(e, phi) != 1:
+        return None
+    return mod_inverse(e, phi)
+
+
+def auditer(cles, budget=10.0, processus=1):
+    """
+    Générateur : tente de casser chaque clé publique (numéro de ligne, e, n) de `cles` (ex. : pgcd_lot.lire_cles).
+    Renvoie pour chaque clé un dictionnaire : ligne, n, bits, e, cassee, facteurs, non_factorises, d, duree.
+    Si la clé est cassée, "cle_privee" contient la ClePriveeRSA reconstruite (2 à MAX_PREMIERS premiers distincts).
+
+    """
+    with Factoriseur(processus) as factoriseur:
+        for numero, e, n in cles:
+            debut = time.perf_counter()
+            premiers, composes = factoriseur.factoriser(n, budget)
+            duree = time.perf_counter() - debut
+            resultat = {"ligne": numero, "n": n, "bits": n.bit_length(), "e": e, "cassee": not composes,
+                        "facteurs": premiers, "non_factorises": composes, "d": None, "cle_privee": None,
+                        "duree": duree}
+            if not composes and e is not None:
+                resultat["d"] = exposant_prive(e, premiers)
+                if resultat["d"] is not None and 2 <= len(premiers) <= MAX_PREMIERS and len(set(premiers)) == len(premiers):
+                    try:
+                        _, resultat["cle_privee"] = rsa_cles_depuis_premiers(premiers[0], premiers[1], e, premiers[2:])
+                    except ValueError:
+                        pass                        # Premier 2, etc. : d suffit, pas de clé privée au format de rsa.py
+            yield resultat
+
+
+def resume_par_taille(resultats):
+    """
+    Temps pour casser par taille de module : {bits: {"cles", "cassees", "duree_moyenne", "duree_max"}}.
+
+    """
+    resume = {}
+    for resultat in resultats:
+        ligne = resume.setdefault(resultat["bits"], {"cles": 0, "cassees": 0, "duree_totale": 0.0, "duree_max": 0.0})
+        ligne["cles"] += 1
+        if resultat["cassee"]:
+            ligne["cassees"] += 1
+            ligne["duree_totale"] += resultat["duree"]
+            ligne["duree_max"] = max(ligne["duree_max"], resultat["duree"])
+    for ligne in resume.values():
+        ligne["duree_moyenne"] = ligne.pop("duree_totale") / ligne["cassees"] if ligne["cassees"] else None
+    return dict(sorted(resume.items()))
+
+
+def _afficher_resume(resume, budget, sortie=sys.stdout):
+    print(f"\n{'bits':>6} {'clés':>6} {'cassées':>8} {'moyenne (s)':>12} {'max (s)':>10}", file=sortie)
+    for bits, ligne in resume.items():
+        moyenne = f"{ligne['duree_moyenne']:12.3f}" if ligne["duree_moyenne"] is not None else f"{'> ' + str(budget):>12}"
+        print(f"{bits:>6} {ligne['cles']:>6} {ligne['cassees']:>8} {moyenne} {ligne['duree_max']:>10.3f}", file=sortie)
+
+
+def _ligne_resultat(resultat):
+    if not resultat["cassee"]:
+        return (f"ligne {resultat['ligne']} : n ({resultat['bits']} bits) résiste après {resultat['duree']:.2f} s "
+                f"(facteurs trouvés : {resultat['facteurs'] or 'aucun'})")
+    facteurs = " × ".join(map(str, resultat["facteurs"]))
+    texte = f"ligne {resultat['ligne']} : n ({resultat['bits']} bits) = {facteurs} en {resultat['duree']:.3f} s"
+    if resultat["d"] is not None:
+        texte += f", d = {resultat['d']}"
+    return texte
+
+
+#****************** Programme principal *********************#
+
+def _lancer_audit(cles, args):
+    resultats = []
+    for resultat in auditer(cles, args.budget, args.processus):
+        resultats.append(resultat)
+        if not args.json:
+            print(_ligne_resultat(resultat), flush=True)
+        if args.cles_privees and resultat["cle_privee"] is not None:
+            from rsa import rsa_enregistrer_cle
+            os.makedirs(args.cles_privees, exist_ok=True)
+            rsa_enregistrer_cle(os.path.join(args.cles_privees, f"ligne_{resultat['ligne']}.json"),
+                                resultat["cle_privee"])
+    resume = resume_par_taille(resultats)
+    if args.json:
+        for resultat in resultats:
+            del resultat["cle_privee"]
+        json.dump({"cles": resultats, "par_taille": resume}, sys.stdout, indent=2)
+        print()
+    else:
+        _afficher_resume(resume, args.budget)
+    return 1 if any(resultat["cassee"] for resultat in resultats) else 0
+
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Factorisation et audit de clés RSA")
+    commandes = analyseur.add_subparsers(dest="commande", required=True)
+
+    p = commandes.add_parser("factoriser", help="Décomposer un entier en facteurs premiers")
+    p.add_argument("n", type=int)
+
+    p = commandes.add_parser("audit", help="Tenter de casser des clés publiques (une par ligne)")
+    p.add_argument("fichier", help="Fichier de clés ('-' : entrée standard), même format que pgcd_lot.py")
+    p.add_argument("--json", action="store_true", help="Rapport au format JSON")
+    p.add_argument("--cles-privees", help="Dossier où écrire les clés privées retrouvées (JSON de rsa.py)")
+
+    p = commandes.add_parser("mesurer", help="Générer des clés de plusieurs tailles et mesurer le temps pour les casser")
+    p.add_argument("--bits", type=int, nargs="+", default=[32, 48, 64, 80, 96])
+    p.add_argument("--cles", type=int, default=3, help="Nombre de clés par taille")
+    p.add_argument("--json", action="store_true", help="Rapport au format JSON")
+
+    for p in commandes.choices.values():
+        p.add_argument("--budget", type=float, default=10.0, help="Temps maximal par clé (secondes)")
+        p.add_argument("--processus", type=int, default=1, help="Nombre de processus (0 : tous les cœurs)")
+    args = analyseur.parse_args()
+    args.cles_privees = getattr(args, "cles_privees", None)
+
+    if args.commande == "factoriser":
+        premiers, composes = factoriser(args.n, args.budget, args.processus)
+        print(f"{args.n} = {' × '.join(map(str, premiers + composes))}")
+        if composes:
+            print(f"Non factorisé dans le budget : {composes}")
+        sys.exit(1 if composes else 0)
+
+    if args.commande == "audit":
+        from pgcd_lot import lire_cles
+        if args.fichier == "-":
+            sys.exit(_lancer_audit(lire_cles(sys.stdin), args))
+        with open(args.fichier, encoding='utf-8') as fichier:
+            sys.exit(_lancer_audit(lire_cles(fichier), args))
+
+    from rsa import rsa_generer_cles_auto
+    cles_generees = []
+    for bits in args.bits:
+        for _ in range(args.cles):
+            (e, n), _ = rsa_generer_cles_auto(bits)
+            cles_generees.append((len(cles_generees) + 1, e, n))
+    _lancer_audit(cles_generees, args)
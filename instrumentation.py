@@ -0,0 +1,259 @@
+# instrumentation.py
+# Mesures internes (optionnelles) des fonctions de chiffrement : nombre d'appels, octets traités,
+# histogramme des latences et, pour RSA, nombre de blocs et d'exponentiations modulaires.
+#
+# Utilisation :
+#   import instrumentation
+#   instrumentation.activer()                   # Remplace les fonctions par des versions mesurées
+#   ... utilisation normale de cesar / vigenere / rsa ...
+#   print(instrumentation.exporter_prometheus())
+#   instrumentation.desactiver()                # Remet les fonctions d'origine
+#
+# Désactivée, l'instrumentation ne coûte RIEN : les fonctions d'origine sont simplement remises en place.
+# Attention : un "from rsa import rsa_chiffrer" fait AVANT activer() garde la fonction d'origine ;
+# seuls les appels du type rsa.rsa_chiffrer(...) sont mesurés.
+
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+
+import cesar
+import rsa
+import vigenere
+
+# Bornes de l'histogramme des latences (en secondes), comme les "buckets" Prometheus
+BORNES_LATENCE = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+_verrou = threading.Lock()
+_originaux = {}                     # (module, nom) → fonction d'origine
+_mesures = {}                       # nom de fonction → dictionnaire de compteurs
+_profileur = None                   # cProfile.Profile actif, ou None
+_profilage_en_cours = threading.local()
+
+
+# ====================== CE QUE L'ON MESURE POUR CHAQUE FONCTION ======================
+def _taille(message):
+    return len(message) if isinstance(message, (str, bytes, bytearray, memoryview)) else 0
+
+
+def _octets_message(args, resultat):
+    return _taille(args[0])
+
+
+def _blocs_chiffrement(args, resultat):
+    # rsa_chiffrer : un bloc = une exponentiation c = m^e mod n
+    return len(resultat), len(resultat)
+
+
+def _blocs_dechiffrement(args, resultat):
+    # Déchiffrement par restes chinois : une exponentiation par bloc et par premier (modulo p, q, r3...)
+    blocs = len(args[0])
+    return blocs, blocs * (len(args[1].premiers) if isinstance(args[1], rsa.ClePriveeRSA) else 1)
+
+
+def _octets_blocs(args, resultat):
+    _, n = args[1]
+    return len(args[0]) * ((n.bit_length() + 7) // 8)
+
+
+# (module, nom de la fonction, calcul des octets traités, calcul (blocs, exponentiations) ou None)
+FONCTIONS = [
+    (cesar, "cesar_chiffrer", _octets_message, None),
+    (cesar, "cesar_dechiffrer", _octets_message, None),
+    (vigenere, "vigenere_chiffrer", _octets_message, None),
+    (vigenere, "vigenere_dechiffrer", _octets_message, None),
+    (rsa, "rsa_chiffrer", _octets_message, _blocs_chiffrement),
+    (rsa, "rsa_dechiffrer", _octets_blocs, _blocs_dechiffrement),
+    (rsa, "rsa_generer_cles", None, None),
+    (rsa, "rsa_generer_cles_auto", None, None),
+]
+
+
+# ====================== ENREGISTREMENT DES MESURES ======================
+def _nouvelles_mesures():
+    return {"appels": 0, "erreurs": 0, "octets": 0, "blocs": 0, "exponentiations": 0,
+            "latence_somme": 0.0, "latence_histogramme": [0] * (len(BORNES_LATENCE) + 1)}
+
+
+def _enregistrer(nom, duree, octets, blocs, exponentiations, erreur):
+    with _verrou:
+        mesures = _mesures.setdefault(nom, _nouvelles_mesures())
+        mesures["appels"] += 1
+        mesures["erreurs"] += erreur
+        mesures["octets"] += octets
+        mesures["blocs"] += blocs
+        mesures["exponentiations"] += exponentiations
+        mesures["latence_somme"] += duree
+        for i, borne in enumerate(BORNES_LATENCE):
+            if duree <= borne:
+                mesures["latence_histogramme"][i] += 1
+                break
+        else:
+            mesures["latence_histogramme"][-1] += 1     # Au-delà de la plus grande borne (+Inf)
+
+
+def _envelopper(fonction, nom, calcul_octets, calcul_blocs):
+    @functools.wraps(fonction)
+    def mesuree(*args, **kwargs):
+        profileur = _profileur
+        profiler = profileur is not None and not getattr(_profilage_en_cours, "actif", False)
+        if profiler:
+            _profilage_en_cours.actif = True
+            profileur.enable()
+        debut = time.perf_counter()
+        resultat = None
+        erreur = False
+        try:
+            resultat = fonction(*args, **kwargs)
+            return resultat
+        except Exception:
+            erreur = True
+            raise
+        finally:
+            duree = time.perf_counter() - debut
+            if profiler:
+                profileur.disable()
+                _profilage_en_cours.actif = False
+            octets, blocs, exponentiations = 0, 0, 0
+            if not erreur:
+                try:
+                    if calcul_octets:
+                        octets = calcul_octets(args, resultat)
+                    if calcul_blocs:
+                        blocs, exponentiations = calcul_blocs(args, resultat)
+                except (IndexError, TypeError, ValueError):
+                    pass                               # Appel inhabituel (mots-clés, générateur...) → non compté
+            _enregistrer(nom, duree, octets, blocs, exponentiations, erreur)
+    return mesuree
+
+
+# ====================== ACTIVATION ======================
+def activer(rsa_auto=None):
+    """
+    Remplace les fonctions de chiffrement par leurs versions mesurées.
+    rsa_auto : module "rsa cle auto.py" déjà chargé, pour mesurer aussi sa génération de clés et OAEP.
+    """
+    fonctions = list(FONCTIONS)
+    if rsa_auto is not None:
+        fonctions += [
+            (rsa_auto, "rsa_generer_cles", None, None),
+            (rsa_auto, "rsa_chiffrer", _octets_message, None),
+            (rsa_auto, "rsa_dechiffrer", _octets_message, None),
+        ]
+    for module, nom, calcul_octets, calcul_blocs in fonctions:
+        if (module, nom) in _originaux:
+            continue                                   # Déjà instrumentée
+        fonction = getattr(module, nom)
+        _originaux[(module, nom)] = fonction
+        nom_metrique = f"{module.__name__}.{nom}"
+        setattr(module, nom, _envelopper(fonction, nom_metrique, calcul_octets, calcul_blocs))
+
+
+def desactiver():
+    """
+    Remet en place les fonctions d'origine (coût nul ensuite). Les mesures déjà prises sont conservées.
+    """
+    for (module, nom), fonction in _originaux.items():
+        setattr(module, nom, fonction)
+    _originaux.clear()
+
+
+def est_active():
+    return bool(_originaux)
+
+
+def reinitialiser():
+    """
+    Efface toutes les mesures.
+    """
+    with _verrou:
+        _mesures.clear()
+
+
+def mesures():
+    """
+    Copie des mesures : {nom de fonction: {"appels", "erreurs", "octets", "blocs", "exponentiations", ...}}
+    """
+    with _verrou:
+        return {nom: dict(m, latence_histogramme=list(m["latence_histogramme"])) for nom, m in _mesures.items()}
+
+
+# ====================== PROFILAGE (activable à chaud) ======================
+def activer_profilage():
+    """
+    Profile (cProfile) l'intérieur de chaque appel mesuré, jusqu'à desactiver_profilage().
+    """
+    global _profileur
+    if _profileur is None:
+        _profileur = cProfile.Profile()
+
+
+def desactiver_profilage():
+    """
+    Arrête le profilage et retourne le rapport des fonctions les plus coûteuses (texte).
+    """
+    global _profileur
+    profileur, _profileur = _profileur, None
+    if profileur is None:
+        return ""
+    sortie = io.StringIO()
+    try:
+        pstats.Stats(profileur, stream=sortie).sort_stats("cumulative").print_stats(25)
+    except TypeError:                                  # Aucun appel profilé
+        return ""
+    return sortie.getvalue()
+
+
+# ====================== EXPORT AU FORMAT PROMETHEUS ======================
+def exporter_prometheus():
+    """
+    Retourne toutes les mesures au format texte de Prometheus.
+    """
+    instantane = mesures()
+    lignes = []
+
+    def serie(nom_metrique, aide, type_metrique, champ):
+        lignes.append(f"# HELP {nom_metrique} {aide}")
+        lignes.append(f"# TYPE {nom_metrique} {type_metrique}")
+        for nom, m in sorted(instantane.items()):
+            lignes.append(f'{nom_metrique}{{fonction="{nom}"}} {m[champ]}')
+
+    serie("chiffrement_appels_total", "Nombre d'appels.", "counter", "appels")
+    serie("chiffrement_erreurs_total", "Nombre d'appels terminés par une exception.", "counter", "erreurs")
+    serie("chiffrement_octets_total", "Octets (ou caractères) traités.", "counter", "octets")
+    serie("rsa_blocs_total", "Blocs RSA chiffrés ou déchiffrés.", "counter", "blocs")
+    serie("rsa_exponentiations_modulaires_total", "Exponentiations modulaires effectuées.", "counter",
+          "exponentiations")
+
+    lignes.append("# HELP chiffrement_latence_secondes Durée des appels.")
+    lignes.append("# TYPE chiffrement_latence_secondes histogram")
+    for nom, m in sorted(instantane.items()):
+        cumul = 0
+        for borne, nombre in zip(BORNES_LATENCE, m["latence_histogramme"]):
+            cumul += nombre
+            lignes.append(f'chiffrement_latence_secondes_bucket{{fonction="{nom}",le="{borne}"}} {cumul}')
+        cumul += m["latence_histogramme"][-1]
+        lignes.append(f'chiffrement_latence_secondes_bucket{{fonction="{nom}",le="+Inf"}} {cumul}')
+        lignes.append(f'chiffrement_latence_secondes_sum{{fonction="{nom}"}} {m["latence_somme"]}')
+        lignes.append(f'chiffrement_latence_secondes_count{{fonction="{nom}"}} {m["appels"]}')
+
+    return "\n".join(lignes) + "\n"
+
+
+#****************** Tester *********************#
+
+if __name__ == "__main__":
+    activer()
+    activer_profilage()
+    for _ in range(100):
+        cesar.cesar_chiffrer("Bonjour le monde", 3)
+        vigenere.vigenere_chiffrer("Attack at dawn", "LEMON")
+    cle_publique, cle_privee = rsa.rsa_generer_cles_auto(1024)
+    rsa.rsa_dechiffrer(rsa.rsa_chiffrer("Message secret " * 20, cle_publique), cle_privee)
+    rapport = desactiver_profilage()
+    desactiver()
+    print(exporter_prometheus())
+    print(rapport[:2000])
@@ -1,11 +1,13 @@
 # main.py
+import argparse
+import os
+import sys
 import cesar
 import vigenere
-from rsa import (
-    rsa_generer_cles,
-    rsa_chiffrer,
-    rsa_dechiffrer
-)
+import registre
+# rsa.py n'est importé que lorsqu'on s'en sert (démarrage plus rapide pour César / Vigénère)
+
+TAILLE_BLOC = 1 << 20                           # Lecture des fichiers par blocs de 1 Mo
 
 def menu():
     print("\n--- Mini Projet Cryptographie ---")
@@ -17,6 +19,15 @@ def menu():
 
 
 def main():
+    import ast                # Imports du menu interactif seulement (démarrage du mode commande plus rapide)
+    from rsa import (
+        rsa_generer_cles,
+        rsa_chiffrer,
+        rsa_dechiffrer,
+        rsa_chiffrer_binaire,
+        rsa_dechiffrer_binaire
+    )
+
     # Variables globales pour les clés RSA
     cle_publique_rsa = None   # (e, n)
     cle_privee_rsa = None     # (d, n)
@@ -94,7 +105,10 @@ def main():
                         chiffre = rsa_chiffrer(message, cle_publique_rsa)
                         print(f"\nMessage chiffré en {len(chiffre)} bloc(s) :")
                         print(chiffre)  # ← affiche la liste proprement
-                        print("\nCopiez cette liste entière pour le déchiffrement !")
+                        # Même message au format binaire compact (en hexadécimal) : restitution exacte
+                        print("\nFormat binaire (hexadécimal) :")
+                        print(rsa_chiffrer_binaire(message, cle_publique_rsa).hex())
+                        print("\nCopiez cette liste entière (ou le texte hexadécimal) pour le déchiffrement !")
                     except ValueError as e:
                         print(f"Erreur : {e}")
                     except Exception as e:
@@ -105,14 +119,18 @@ def main():
                     print("Veuillez d'abord générer les clés RSA (Option 1).")
                     
                 else:
-                    print("\nCollez exactement la liste affichée après le chiffrement")
-                    entrée = input("→ ")
+                    print("\nCollez exactement la liste (ou le texte hexadécimal) affichée après le chiffrement")
+                    entrée = input("→ ").strip()
                     try:
-                        # On accepte la liste telle quelle (grâce à eval – OK pour un projet étudiant)
-                       blocs = eval(entrée)
-                       if not isinstance(blocs, list):
-                           raise ValueError("Ce n'est pas une liste")
-                       dechiffre = rsa_dechiffrer(blocs, cle_privee_rsa)
+                       if entrée.startswith('['):
+                           # On lit la liste sans exécuter de code (literal_eval au lieu de eval)
+                           blocs = ast.literal_eval(entrée)
+                           if not isinstance(blocs, list):
+                               raise ValueError("Ce n'est pas une liste")
+                           dechiffre = rsa_dechiffrer(blocs, cle_privee_rsa)
+                       else:
+                           # Format binaire en hexadécimal
+                           dechiffre = rsa_dechiffrer_binaire(bytes.fromhex(entrée), cle_privee_rsa).decode('utf-8')
                        print(f"\nMessage déchiffré :\n{dechiffre}")
                     
                     except Exception as e:
@@ -133,5 +151,165 @@ def main():
             print("Choix invalide. Veuillez réessayer.")
 
 
+# ====================== MODE LIGNE DE COMMANDE (sans menu) ======================
+# Exemples :
+#   python main.py cesar -c --cle 3 -i message.txt -o chiffre.txt
+#   cat messages.txt | python main.py vigenere -c --cle LEMON --lignes > chiffres.txt
+#   python main.py vigenere -c --cle LEMON -i gros.txt -o gros.vig --processus 0   (tous les cœurs)
+#   python main.py rsa --generer --bits 2048 --cle-publique pub.json --cle-privee priv.json
+#   python main.py rsa --generer --bits 4096 --premiers 3 --cle-publique pub.json --cle-privee priv.json
+#   python main.py rsa -c --cle-publique pub.json -i gros_fichier.bin -o gros_fichier.rsa
+#   python main.py rsa-oaep -d --cle-privee priv.pem --lignes -i jetons.txt
+# Sans -i / -o, on lit l'entrée standard et on écrit sur la sortie standard.
+# --lignes : chaque ligne est un message indépendant (la clé Vigénère repart du début à chaque ligne,
+# en RSA chaque ligne chiffrée est écrite en hexadécimal sur une ligne).
+
+def _ouvrir(chemin, mode):
+    # Fichier donné → on l'ouvre ; sinon entrée/sortie standard en binaire
+    if chemin and chemin != "-":
+        return open(chemin, mode)
+    flux = sys.stdin if "r" in mode else sys.stdout
+    return os.fdopen(os.dup(flux.fileno()), mode)
+
+
+def _cli_cesar(args, entree, sortie):
+    cle = int(args.cle)
+    transformer = cesar.cesar_chiffrer if args.chiffrer else cesar.cesar_dechiffrer
+    # César n'a pas d'état : lignes ou blocs donnent le même résultat, on lit donc par gros blocs
+    while True:
+        bloc = entree.read(TAILLE_BLOC)
+        if not bloc:
+            break
+        sortie.write(transformer(bloc, cle))
+
+
+def _cli_vigenere(args, entree, sortie):
+    flux = vigenere.VigenereFlux(args.cle, dechiffrer=args.dechiffrer)
+    if not args.lignes:
+        flux.traiter_fichier(entree, sortie, TAILLE_BLOC)    # Tout le fichier = un seul message
+        return
+    for ligne in entree:
+        flux.cle_index = 0                       # Nouveau message → on repart du début de la clé
+        sortie.write(flux.traiter(ligne))
+
+
+def _cli_rsa(args, entree, sortie):
+    from rsa import rsa_chiffrer_binaire, rsa_dechiffrer_binaire, rsa_chiffrer_flux, rsa_dechiffrer_flux, rsa_charger_cle
+    if args.chiffrer:
+        cle_publique = rsa_charger_cle(args.cle_publique)
+        if args.lignes:
+            for ligne in entree:
+                sortie.write(rsa_chiffrer_binaire(ligne.rstrip(b"\r\n"), cle_publique).hex().encode() + b"\n")
+        elif entree.seekable():
+            rsa_chiffrer_flux(entree, sortie, cle_publique)
+        else:
+            # Tube (pipe) : la longueur n'est connue qu'à la fin, on lit donc tout le message
+            sortie.write(rsa_chiffrer_binaire(entree.read(), cle_publique))
+    else:
+        cle_privee = rsa_charger_cle(args.cle_privee)
+        if args.lignes:
+            for ligne in entree:
+                if ligne.strip():
+                    sortie.write(rsa_dechiffrer_binaire(bytes.fromhex(ligne.decode().strip()), cle_privee) + b"\n")
+        else:
+            rsa_dechiffrer_flux(entree, sortie, cle_privee)
+
+
+def _cli_rsa_oaep(args, entree, sortie):
+    rsa_auto = registre.charger_rsa_auto()
+    serialization = rsa_auto.serialization
+    if args.chiffrer:
+        with open(args.cle_publique, 'rb') as fichier:
+            cle_publique = serialization.load_pem_public_key(fichier.read())
+        if args.lignes:
+            # Messages courts : OAEP direct, par paquets sur plusieurs fils (jamais tout le fichier en mémoire)
+            messages = (ligne.rstrip(b"\r\n") for ligne in entree)
+            for chiffre in rsa_auto.rsa_chiffrer_iter(messages, cle_publique):
+                sortie.write(chiffre.hex().encode() + b"\n")
+        else:
+            rsa_auto.rsa_chiffrer_flux(entree, sortie, cle_publique)    # Mode hybride, taille quelconque
+    else:
+        with open(args.cle_privee, 'rb') as fichier:
+            cle_privee = serialization.load_pem_private_key(fichier.read(), password=None)
+        if args.lignes:
+            chiffres = (bytes.fromhex(ligne.decode().strip()) for ligne in entree if ligne.strip())
+            for clair in rsa_auto.rsa_dechiffrer_iter(chiffres, cle_privee):
+                sortie.write(clair.encode('utf-8') + b"\n")
+        else:
+            rsa_auto.rsa_dechiffrer_flux(entree, sortie, cle_privee)
+
+
+def _cli_generer(args):
+    if not (args.cle_publique and args.cle_privee):
+        raise ValueError("--generer demande --cle-publique et --cle-privee.")
+    if args.algorithme == "rsa":
+        from rsa import rsa_generer_cles_auto, rsa_enregistrer_cle
+        cle_publique, cle_privee = rsa_generer_cles_auto(args.bits, nombre_premiers=args.premiers)
+        rsa_enregistrer_cle(args.cle_publique, cle_publique)
+        rsa_enregistrer_cle(args.cle_privee, cle_privee)
+        return
+    rsa_auto = registre.charger_rsa_auto()
+    serialization = rsa_auto.serialization
+    cle_privee, cle_publique = rsa_auto.rsa_generer_cles(args.bits)
+    with open(args.cle_privee, 'wb') as fichier:
+        fichier.write(cle_privee.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                               serialization.NoEncryption()))
+    with open(args.cle_publique, 'wb') as fichier:
+        fichier.write(cle_publique.public_bytes(serialization.Encoding.PEM,
+                                                serialization.PublicFormat.SubjectPublicKeyInfo))
+
+
+def ligne_de_commande(arguments):
+    analyseur = argparse.ArgumentParser(prog="main.py", description="Mini Projet Cryptographie (mode commande)")
+    sous_commandes = analyseur.add_subparsers(dest="algorithme", required=True)
+
+    for nom in ("cesar", "vigenere", "rsa", "rsa-oaep"):
+        p = sous_commandes.add_parser(nom)
+        action = p.add_mutually_exclusive_group(required=True)
+        action.add_argument("-c", "--chiffrer", action="store_true", help="Chiffrer")
+        action.add_argument("-d", "--dechiffrer", action="store_true", help="Déchiffrer")
+        if nom in ("rsa", "rsa-oaep"):
+            action.add_argument("--generer", action="store_true", help="Générer une paire de clés")
+            p.add_argument("--cle-publique", help="Fichier de la clé publique")
+            p.add_argument("--cle-privee", help="Fichier de la clé privée")
+            p.add_argument("--bits", type=int, default=2048, help="Taille de clé pour --generer")
+        if nom == "rsa":
+            p.add_argument("--premiers", type=int, default=2,
+                           help="Nombre de premiers de la clé pour --generer (3 ou 4 : RSA multi-premiers)")
+        if nom in ("cesar", "vigenere"):
+            p.add_argument("--cle", required=True, help="Clé (entier pour César, mot pour Vigénère)")
+        p.add_argument("-i", "--entree", help="Fichier à lire (défaut : entrée standard)")
+        p.add_argument("-o", "--sortie", help="Fichier à écrire (défaut : sortie standard)")
+        p.add_argument("--lignes", action="store_true", help="Traiter chaque ligne comme un message séparé")
+        if nom == "vigenere":
+            p.add_argument("--processus", type=int, default=1,
+                           help="Gros fichier (-i et -o) traité sur plusieurs processus (0 : tous les cœurs)")
+
+    args = analyseur.parse_args(arguments)
+    traitements = {"cesar": _cli_cesar, "vigenere": _cli_vigenere, "rsa": _cli_rsa, "rsa-oaep": _cli_rsa_oaep}
+
+    try:
+        if getattr(args, "generer", False):
+            _cli_generer(args)
+            return 0
+        if args.algorithme in ("rsa", "rsa-oaep"):
+            cle_requise = args.cle_publique if args.chiffrer else args.cle_privee
+            if not cle_requise:
+                raise ValueError("Fichier de clé manquant (--cle-publique pour chiffrer, --cle-privee pour déchiffrer).")
+        fichiers = args.entree not in (None, "-") and args.sortie not in (None, "-")
+        if getattr(args, "processus", 1) != 1 and fichiers and not args.lignes:
+            # Vigénère parallèle : il faut des fichiers (mmap), pas l'entrée/sortie standard
+            vigenere.vigenere_fichier(args.entree, args.sortie, args.cle, args.dechiffrer, processus=args.processus)
+            return 0
+        with _ouvrir(args.entree, 'rb') as entree, _ouvrir(args.sortie, 'wb') as sortie:
+            traitements[args.algorithme](args, entree, sortie)
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(ligne_de_commande(sys.argv[1:]))   # Arguments → mode commande
+    main()                                          # Sans argument → menu interactif habituel
\ No newline at end of file
@@ -0,0 +1,242 @@
+# pgcd_lot.py
+# Détection de clés RSA faibles par PGCD en lot ("batch GCD")
+#
+# Deux modules n1 = p × q1 et n2 = p × q2 qui partagent un premier p sont cassés par pgcd(n1, n2) = p.
+# Au lieu de calculer pgcd(ni, nj) pour toutes les paires (coût quadratique), on construit :
+#   1. l'arbre des produits : feuilles = modules, chaque nœud = produit de ses deux fils, racine P = produit de tous ;
+#   2. l'arbre des restes : en redescendant, P mod n² pour chaque module ;
+#   3. pgcd(n, (P mod n²) / n) = pgcd(n, produit des AUTRES modules) → > 1 si n partage un premier.
+# Coût quasi linéaire, dominé par quelques multiplications et divisions de très grands entiers.
+# Les restes sont calculés sans aucune grande division (arbre des restes "mis à l'échelle", voir pgcd_lot).
+# gmpy2 (optionnel) accélère encore les grandes multiplications ; sans lui, on utilise les entiers de Python.
+#
+# Utilisation :
+#   python pgcd_lot.py cles.txt                  (une clé publique par ligne)
+#   cat cles.txt | python pgcd_lot.py - --json   (rapport JSON)
+# Formats de ligne acceptés : {"e": 17, "n": 3233} (JSON), "(17, 3233)", "17 3233", ou le module n seul.
+# Lignes vides et commentaires (#) ignorés.
+
+import argparse
+import json
+import math
+import re
+import sys
+
+from rsa import est_probablement_premier
+
+_ENTIERS = re.compile(r"\d+")
+PRECISION_DIRECTE = 4096                         # Inverse sur moins de bits : division ordinaire
+
+
+# ====================== LECTURE DES CLÉS (en flux) ======================
+def lire_cles(fichier):
+    """
+    Générateur : lit un fichier ouvert ligne par ligne et renvoie (numéro de ligne, e ou None, n).
+
+    """
+    for numero, ligne in enumerate(fichier, 1):
+        ligne = ligne.strip()
+        if not ligne or ligne.startswith('#'):
+            continue
+        if ligne.startswith('{'):
+            contenu = json.loads(ligne)
+            yield numero, contenu.get("e"), int(contenu["n"])
+            continue
+        nombres = _ENTIERS.findall(ligne)
+        if not nombres:
+            raise ValueError(f"Ligne {numero} : aucune clé reconnue ({ligne[:40]!r}).")
+        if len(nombres) == 1:
+            yield numero, None, int(nombres[0])
+        else:
+            yield numero, int(nombres[-2]), int(nombres[-1])   # "Clé publique (e, n) = (17, 3233)" → (17, 3233)
+
+
+# ====================== PGCD EN LOT ======================
+def _arithmetique():
+    """
+    (type entier, fonction pgcd) : ceux de gmpy2 s'il est installé, sinon ceux de Python.
+
+    """
+    try:
+        import gmpy2
+        return gmpy2.mpz, gmpy2.gcd
+    except ImportError:
+        return int, math.gcd
+
+
+def _inverse(m, k):
+    """
+    Approximation de 2^k / m à quelques unités près (k >= nombre de bits de m), par la méthode de Newton :
+    on calcule l'inverse à demi-précision (récursivement), puis une itération double le nombre de bits justes.
+    Seulement des multiplications (Karatsuba), pas de grande division (quadratique avec les entiers de Python).
+
+    """
+    precision = k - m.bit_length() + 1           # Nombre de bits du résultat
+    inutiles = m.bit_length() - (precision + 64)  # Bits de poids faible de m sans effet sur le résultat
+    if inutiles > 0:
+        m >>= inutiles
+        k -= inutiles
+    if precision <= PRECISION_DIRECTE:
+        return (1 << k) // m
+    moitie = precision // 2 + 32
+    y = _inverse(m, k - (precision - moitie)) << (precision - moitie)
+    return y + ((y * ((1 << k) - m * y)) >> k)  # y ← y + y (1 - m y / 2^k)
+
+
+def arbre_produits(nombres):
+    """
+    Niveaux de l'arbre des produits : [feuilles, produits deux à deux, ..., [produit total]].
+
+    """
+    niveaux = [list(nombres)]
+    while len(niveaux[-1]) > 1:
+        niveau = niveaux[-1]
+        niveaux.append([niveau[i] * niveau[i + 1] if i + 1 < len(niveau) else niveau[i]
+                        for i in range(0, len(niveau), 2)])
+    return niveaux
+
+
+def pgcd_lot(modules):
+    """
+    Pour chaque module n, retourne pgcd(n, produit de tous les AUTRES modules) en temps quasi linéaire.
+    Les modules doivent être distincts (un module en double donnerait pgcd = n).
+
+    """
+    if len(modules) < 2:
+        return [1] * len(modules)
+    entier, pgcd = _arithmetique()
+    niveaux = arbre_produits([entier(n) for n in modules])
+
+    # Arbre des restes "mis à l'échelle" (Bernstein) : au lieu de P mod v² (une grande division par nœud),
+    # chaque nœud v garde la partie fractionnaire de P / v², en virgule fixe (F / 2^precision).
+    # Pour un fils c de frère s : P / c² = (P / v²) × s², donc frac(P / c²) = frac(frac(P / v²) × s²) :
+    # une seule multiplication par nœud. La seule division est l'inverse de P à la racine (Newton).
+    garde = 64 + 2 * len(niveaux)                # Bits de marge : l'erreur double au plus à chaque niveau
+    produit = niveaux[-1][0]
+    precisions = [2 * produit.bit_length() + garde]
+    fractions = [_inverse(produit, precisions[0])]   # frac(P / P²) = 1 / P
+    for niveau in reversed(niveaux[:-1]):
+        carres = [valeur * valeur for valeur in niveau]
+        nouvelles_fractions, nouvelles_precisions = [], []
+        for i, carre in enumerate(carres):
+            fraction, precision = fractions[i // 2], precisions[i // 2]
+            if i ^ 1 < len(carres):              # Nœud sans frère (nombre impair) : rien à multiplier
+                fraction = (fraction * carres[i ^ 1]) & ((1 << precision) - 1)   # Partie fractionnaire
+            precision_fils = carre.bit_length() + garde
+            nouvelles_fractions.append(fraction >> (precision - precision_fils))
+            nouvelles_precisions.append(precision_fils)
+        fractions, precisions = nouvelles_fractions, nouvelles_precisions
+
+    # Feuilles : P mod n² = n² × frac(P / n²), arrondi à l'entier le plus proche
+    resultats = []
+    for n, fraction, precision in zip(niveaux[0], fractions, precisions):
+        reste = (fraction * n * n + (1 << (precision - 1))) >> precision
+        resultats.append(int(pgcd(reste // n, n)))
+    return resultats
+
+
+# ====================== ANALYSE D'UN ENSEMBLE DE CLÉS ======================
+def analyser(cles):
+    """
+    Cherche les clés faibles parmi des clés publiques [(numéro de ligne, e, n), ...] (ex. : lire_cles(fichier)).
+    Retourne un dictionnaire :
+        "cles"      : nombre de clés lues
+        "modules"   : nombre de modules distincts
+        "doublons"  : [[lignes qui ont exactement le même module], ...]
+        "factorises": [{"n", "lignes", "facteurs": [p, q], "premiers": bool, "partage_avec": [lignes]}, ...]
+        "non_separes": [{"n", "lignes"}, ...]  (facteurs communs détectés mais impossibles à isoler)
+
+    """
+    lignes_par_module = {}                       # n → lignes où il apparaît (les doublons sont regroupés)
+    nombre_cles = 0
+    for numero, _, n in cles:
+        nombre_cles += 1
+        lignes_par_module.setdefault(n, []).append(numero)
+    modules = list(lignes_par_module)
+
+    # Modules qui partagent au moins un premier avec un autre
+    suspects = [(n, g) for n, g in zip(modules, pgcd_lot(modules)) if g > 1]
+
+    # pgcd = n : les deux premiers de n sont partagés (avec des modules différents) → on les sépare
+    # par des pgcd deux à deux, limités aux seuls modules suspects (peu nombreux)
+    facteurs = {}
+    for n, g in suspects:
+        if g == n:
+            for m, _ in suspects:
+                h = math.gcd(n, m)
+                if 1 < h < n:
+                    g = h
+                    break
+        if g != n:
+            facteurs[n] = sorted((g, n // g))
+
+    # Qui partage quel premier avec qui
+    modules_par_facteur = {}
+    for n, (p, q) in facteurs.items():
+        for facteur in (p, q):
+            modules_par_facteur.setdefault(facteur, []).append(n)
+
+    factorises = []
+    for n, (p, q) in facteurs.items():
+        partenaires = {m for facteur in (p, q) for m in modules_par_facteur[facteur] if m != n}
+        factorises.append({
+            "n": n,
+            "lignes": lignes_par_module[n],
+            "facteurs": [p, q],
+            "premiers": est_probablement_premier(p) and est_probablement_premier(q),
+            "partage_avec": sorted(ligne for m in partenaires for ligne in lignes_par_module[m]),
+        })
+    factorises.sort(key=lambda resultat: resultat["lignes"][0])
+
+    return {
+        "cles": nombre_cles,
+        "modules": len(modules),
+        "doublons": [lignes for lignes in lignes_par_module.values() if len(lignes) > 1],
+        "factorises": factorises,
+        "non_separes": [{"n": n, "lignes": lignes_par_module[n]} for n, _ in suspects if n not in facteurs],
+    }
+
+
+def afficher_rapport(rapport, sortie=sys.stdout):
+    """
+    Écrit le rapport de analyser() sous forme lisible.
+
+    """
+    print(f"Clés analysées : {rapport['cles']} ({rapport['modules']} modules distincts)", file=sortie)
+    print(f"Modules en double : {len(rapport['doublons'])}", file=sortie)
+    if rapport["doublons"]:
+        print("  (mêmes p et q : chaque propriétaire peut déchiffrer les messages des autres)", file=sortie)
+    for lignes in rapport["doublons"]:
+        print(f"  lignes {', '.join(map(str, lignes))}", file=sortie)
+    print(f"Modules factorisés : {len(rapport['factorises'])}", file=sortie)
+    for resultat in rapport["factorises"]:
+        p, q = resultat["facteurs"]
+        lignes = ", ".join(map(str, resultat["lignes"]))
+        partage = ", ".join(map(str, resultat["partage_avec"]))
+        print(f"  ligne {lignes} : n = {resultat['n']} = {p} × {q}  (facteur commun avec : {partage})", file=sortie)
+    if rapport["non_separes"]:
+        print(f"Facteurs communs non séparés : {len(rapport['non_separes'])}", file=sortie)
+        for resultat in rapport["non_separes"]:
+            print(f"  ligne {', '.join(map(str, resultat['lignes']))} : n = {resultat['n']}", file=sortie)
+
+
+#****************** Programme principal *********************#
+
+if __name__ == "__main__":
+    analyseur = argparse.ArgumentParser(description="Recherche de facteurs communs entre clés publiques RSA")
+    analyseur.add_argument("fichier", help="Fichier de clés, une par ligne ('-' : entrée standard)")
+    analyseur.add_argument("--json", action="store_true", help="Rapport au format JSON")
+    args = analyseur.parse_args()
+
+    if args.fichier == "-":
+        rapport = analyser(lire_cles(sys.stdin))
+    else:
+        with open(args.fichier, encoding='utf-8') as fichier:
+            rapport = analyser(lire_cles(fichier))
+
+    if args.json:
+        json.dump(rapport, sys.stdout, indent=2)
+        print()
+    else:
+        afficher_rapport(rapport)
+    sys.exit(1 if rapport["factorises"] or rapport["doublons"] or rapport["non_separes"] else 0)
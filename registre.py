@@ -0,0 +1,208 @@
+# registre.py
+# Registre commun des algorithmes de chiffrement, chargés à la demande
+#
+# Tous les algorithmes offrent la même interface :
+#   chiffre = registre.obtenir("vigenere")
+#   cle_chiffrement, cle_dechiffrement = chiffre.generer_cles()
+#   donnees = chiffre.chiffrer(message, cle_chiffrement)
+#   message = chiffre.dechiffrer(donnees, cle_dechiffrement)
+# Pour César et Vigénère, les deux clés sont identiques ; pour RSA c'est (clé publique, clé privée).
+# Types, les mêmes pour tous les algorithmes : chiffrer reçoit str (encodé en UTF-8) ou bytes et retourne
+# des bytes ; dechiffrer reçoit des bytes et retourne des bytes (le message exact, à décoder si besoin).
+#
+# Aucun module de chiffrement n'est importé tant qu'on ne s'en sert pas : utiliser César ne charge
+# ni rsa.py ni la bibliothèque cryptography (dont l'import coûte à lui seul plusieurs dizaines de ms).
+
+import importlib
+import os
+import sys
+from abc import ABC, abstractmethod
+
+_modules_charges = {}
+
+
+def charger_module(nom):
+    """
+    Importe un module du projet au premier appel seulement.
+    "rsa cle auto" contient des espaces : il est chargé directement depuis son fichier.
+    """
+    if nom not in _modules_charges:
+        if nom == "rsa cle auto":
+            from importlib.util import module_from_spec, spec_from_file_location
+            chemin = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rsa cle auto.py")
+            spec = spec_from_file_location("rsa_cle_auto", chemin)
+            module = module_from_spec(spec)
+            sys.modules["rsa_cle_auto"] = module          # Retrouvable comme un module normal (pickle...)
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules["rsa_cle_auto"]           # cryptography absente, etc. : on ne garde rien
+                raise
+        else:
+            module = importlib.import_module(nom)
+        _modules_charges[nom] = module
+    return _modules_charges[nom]
+
+
+def charger_rsa_auto():
+    """
+    Module "rsa cle auto.py" (RSA OAEP avec la bibliothèque cryptography).
+    """
+    return charger_module("rsa cle auto")
+
+
+# ====================== ALGORITHMES ======================
+def _en_octets(message):
+    return message.encode('utf-8') if isinstance(message, str) else bytes(message)
+
+
+class Chiffre(ABC):
+    """
+    Interface commune. nom_module : module importé au premier usage (propriété `module`).
+    chiffrer(message : str ou bytes, cle) → bytes ; dechiffrer(donnees : bytes, cle) → bytes.
+    """
+    nom = ""
+    nom_module = ""
+    symetrique = True
+
+    @property
+    def module(self):
+        return charger_module(self.nom_module)
+
+    @abstractmethod
+    def generer_cles(self, **options):
+        """
+        Retourne (clé de chiffrement, clé de déchiffrement).
+        """
+
+    @abstractmethod
+    def chiffrer(self, message, cle):
+        """
+        Chiffre `message` (str, encodé en UTF-8, ou bytes) et retourne des bytes.
+        """
+
+    @abstractmethod
+    def dechiffrer(self, donnees, cle):
+        """
+        Déchiffre des bytes produits par chiffrer() et retourne le message exact (bytes).
+        """
+
+
+class Cesar(Chiffre):
+    """
+    César sur les octets : seules les lettres ASCII changent, un texte UTF-8 reste valide.
+    """
+    nom = "cesar"
+    nom_module = "cesar"
+
+    def generer_cles(self):
+        import secrets
+        cle = secrets.randbelow(25) + 1                  # Décalage de 1 à 25 (0 ne chiffre rien)
+        return cle, cle
+
+    def chiffrer(self, message, cle):
+        return self.module.cesar_chiffrer(_en_octets(message), cle)
+
+    def dechiffrer(self, donnees, cle):
+        return self.module.cesar_dechiffrer(_en_octets(donnees), cle)
+
+
+class Vigenere(Chiffre):
+    """
+    Vigénère sur les octets : même résultat que sur le texte (seules les lettres ASCII font avancer la clé).
+    """
+    nom = "vigenere"
+    nom_module = "vigenere"
+
+    def generer_cles(self, longueur=12):
+        import secrets
+        cle = "".join(secrets.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(longueur))
+        return cle, cle
+
+    def chiffrer(self, message, cle):
+        return self.module.vigenere_chiffrer(_en_octets(message), cle)
+
+    def dechiffrer(self, donnees, cle):
+        return self.module.vigenere_dechiffrer(_en_octets(donnees), cle)
+
+
+class RSA(Chiffre):
+    """
+    RSA fait main (rsa.py), au format binaire : le message est restitué exactement (bytes).
+    """
+    nom = "rsa"
+    nom_module = "rsa"
+    symetrique = False
+
+    def generer_cles(self, bits=2048, nombre_premiers=2):
+        return self.module.rsa_generer_cles_auto(bits, nombre_premiers=nombre_premiers)
+
+    def chiffrer(self, message, cle):
+        return self.module.rsa_chiffrer_binaire(message, cle)
+
+    def dechiffrer(self, donnees, cle):
+        return self.module.rsa_dechiffrer_binaire(donnees, cle)
+
+
+class RSAOAEP(Chiffre):
+    """
+    RSA OAEP de "rsa cle auto.py", en mode hybride (AES-GCM) pour accepter des messages de toute taille.
+    """
+    nom = "rsa-oaep"
+    nom_module = "rsa cle auto"
+    symetrique = False
+
+    def generer_cles(self, bits=2048):
+        cle_privee, cle_publique = self.module.rsa_generer_cles(bits)
+        return cle_publique, cle_privee
+
+    def chiffrer(self, message, cle):
+        return self.module.rsa_chiffrer_hybride(message, cle)
+
+    def dechiffrer(self, donnees, cle):
+        return self.module.rsa_dechiffrer_hybride(donnees, cle)
+
+
+# ====================== REGISTRE ======================
+_fabriques = {classe.nom: classe for classe in (Cesar, Vigenere, RSA, RSAOAEP)}
+_instances = {}
+
+
+def enregistrer(nom, fabrique):
+    """
+    Ajoute un algorithme : `fabrique()` doit retourner un objet qui suit l'interface de Chiffre
+    (le plus simple : une sous-classe de Chiffre).
+    """
+    _fabriques[nom] = fabrique
+    _instances.pop(nom, None)
+
+
+def obtenir(nom):
+    """
+    Retourne l'algorithme `nom` (créé une seule fois). Son module n'est importé qu'à la première opération.
+    """
+    if nom not in _instances:
+        if nom not in _fabriques:
+            raise ValueError(f"Algorithme inconnu : {nom} (disponibles : {', '.join(noms())})")
+        _instances[nom] = _fabriques[nom]()
+    return _instances[nom]
+
+
+def noms():
+    return sorted(_fabriques)
+
+
+#****************** Tester *********************#
+
+if __name__ == "__main__":
+    for nom in noms():
+        chiffre = obtenir(nom)
+        try:
+            cle_chiffrement, cle_dechiffrement = chiffre.generer_cles()
+        except ImportError as erreur:
+            print(f"{nom:10s} indisponible ({erreur})")
+            continue
+        texte_chiffre = chiffre.chiffrer("Bonjour le monde", cle_chiffrement)
+        resultat = chiffre.dechiffrer(texte_chiffre, cle_dechiffrement)
+        print(f"{nom:10s} {'Succès' if resultat == 'Bonjour le monde'.encode('utf-8') else 'Échec'}")
+    print("Modules chargés :", sorted(m for m in sys.modules if m in ("cesar", "vigenere", "rsa", "rsa_cle_auto")))
@@ -11,7 +11,7 @@ from cryptography.hazmat.primitives import hashes
 # → hashes     : pour utiliser SHA256 (fonction de hachage cryptographique sécurisée)
 
 from cryptography.hazmat.primitives import serialization
-# → serialization : (non utilisé ici, mais souvent pour sauvegarder les clés dans un fichier)
+# → serialization : pour sauvegarder/recharger les clés dans un fichier (PEM ou DER), voir CacheCles
 
 from cryptography.hazmat.primitives.asymmetric.padding import OAEP, MGF1
 # → OAEP et MGF1 : schéma de padding moderne et sécurisé (recommandé par les experts)
@@ -19,16 +19,34 @@ from cryptography.hazmat.primitives.asymmetric.padding import OAEP, MGF1
 from cryptography.hazmat.backends import default_backend
 # → default_backend() : utilise le meilleur moteur cryptographique disponible sur la machine (OpenSSL, etc.)
 
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+# → AESGCM : chiffrement symétrique authentifié (AES en mode GCM), pour le mode hybride
+
+from cryptography.exceptions import InvalidTag
+# → InvalidTag : levée par AESGCM si un morceau a été modifié (convertie en ValueError)
+
+import collections
+import io
+import itertools
+import os
+import queue
+import re
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 
 # ====================== GÉNÉRATION DES CLÉS ======================
-def rsa_generer_cles():
+def rsa_generer_cles(taille_cle=2048):
     """
     Génère une paire de clés RSA 2048 bits (standard de sécurité actuel).
+    Paramètres :
+        taille_cle : taille en bits (2048 par défaut)
     Retourne : (clé_privée, clé_publique)
     """
     private_key = rsa.generate_private_key(
         public_exponent=65537,        # Valeur standard (FIPS 186-4) — très utilisée, sûre et rapide
-        key_size=2048,                # Taille de la clé en bits → 2048 = niveau de sécurité bancaire/militaire
+        key_size=taille_cle,          # Taille de la clé en bits → 2048 = niveau de sécurité bancaire/militaire
         backend=default_backend()     # Utilise le moteur cryptographique du système (OpenSSL)
     )
     # La clé publique est dérivée automatiquement de la clé privée
@@ -38,6 +56,196 @@ def rsa_generer_cles():
     return private_key, public_key
 
 
+# ====================== RÉSERVE DE CLÉS PRÉ-GÉNÉRÉES ======================
+TAILLE_CLE_MIN = 1024                            # En dessous, cryptography refuse de générer la clé
+
+class ReserveCles:
+    """
+    Garde `taille` paires de clés déjà générées, prêtes à être servies immédiatement.
+    Des fils d'exécution en arrière-plan regénèrent des clés dès que la réserve
+    descend à `seuil_bas` clés ou moins, jusqu'à la remplir de nouveau.
+    Si la génération échoue, prendre() relève l'erreur au lieu d'attendre indéfiniment.
+    """
+
+    def __init__(self, taille=8, seuil_bas=2, taille_cle=2048, nb_fils=2):
+        if not 0 <= seuil_bas < taille:
+            raise ValueError("Il faut 0 <= seuil_bas < taille.")
+        if not isinstance(taille_cle, int) or taille_cle < TAILLE_CLE_MIN:
+            raise ValueError(f"La taille de clé doit être un entier d'au moins {TAILLE_CLE_MIN} bits.")
+        self.taille = taille
+        self.seuil_bas = seuil_bas
+        self.taille_cle = taille_cle
+        self._cles = collections.deque()
+        # Un seul verrou (dans la Condition) protège tout l'état partagé : clés prêtes, signal de remplissage,
+        # arrêt, erreur, clés en cours de génération. Aucun signal ne peut donc se perdre.
+        self._condition = threading.Condition()
+        self._remplissage = True                 # Au démarrage, la réserve est vide → on la remplit
+        self._arret = False
+        self._erreur = None                      # Exception d'un fil de génération, relevée par prendre()
+        self._en_cours = 0                       # Clés en cours de génération (pour ne pas dépasser `taille`)
+        self._fils = [threading.Thread(target=self._travailler, daemon=True) for _ in range(nb_fils)]
+        for fil in self._fils:
+            fil.start()
+
+    def _travailler(self):
+        while True:
+            with self._condition:
+                while not self._arret and self._erreur is None:
+                    if len(self._cles) + self._en_cours >= self.taille:
+                        self._remplissage = False    # Réserve pleine → on attend le prochain signal
+                    elif self._remplissage:
+                        break
+                    self._condition.wait()
+                if self._arret or self._erreur is not None:
+                    return
+                self._en_cours += 1
+            try:
+                paire = rsa_generer_cles(self.taille_cle)
+            except Exception as erreur:
+                with self._condition:
+                    self._en_cours -= 1
+                    self._erreur = erreur
+                    self._condition.notify_all()     # Réveille prendre() (et les autres fils, qui s'arrêtent)
+                return
+            with self._condition:
+                self._cles.append(paire)             # Sous le verrou : clé comptée une fois, jamais deux
+                self._en_cours -= 1
+                self._condition.notify_all()
+
+    def prendre(self, timeout=None):
+        """
+        Retourne une paire (clé_privée, clé_publique) de la réserve.
+        Attend au plus `timeout` secondes si la réserve est vide (None = sans limite) : queue.Empty ensuite.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._cles or self._erreur is not None or self._arret, timeout):
+                raise queue.Empty
+            if not self._cles:
+                if self._erreur is not None:
+                    raise self._erreur
+                raise RuntimeError("Réserve de clés fermée.")
+            paire = self._cles.popleft()
+            if len(self._cles) <= self.seuil_bas:
+                self._remplissage = True         # Seuil bas atteint → les fils regénèrent des clés
+                self._condition.notify_all()
+        return paire
+
+    def __len__(self):
+        with self._condition:
+            return len(self._cles)
+
+    def fermer(self):
+        """
+        Arrête les fils de génération.
+        """
+        with self._condition:
+            self._arret = True
+            self._condition.notify_all()         # Réveille les fils pour qu'ils voient l'arrêt
+        for fil in self._fils:
+            fil.join()
+
+
+# ====================== CACHE DE CLÉS SUR DISQUE ======================
+_IDENTIFIANT = re.compile(r"[0-9a-f]{64}")               # Empreinte SHA256 en hexadécimal (minuscules)
+
+class CacheCles:
+    """
+    Enregistre et recharge des clés privées dans un dossier, une clé par fichier, rangées par identifiant.
+    L'identifiant est l'empreinte SHA256 de la clé publique. Une clé déjà chargée reste en mémoire :
+    la recharger ne coûte alors qu'une recherche dans un dictionnaire.
+    """
+
+    def __init__(self, dossier, format_fichier="pem", mot_de_passe=None, verifier_cles=True):
+        if format_fichier not in ("pem", "der"):
+            raise ValueError("Format inconnu : 'pem' ou 'der'.")
+        self.dossier = dossier
+        self.format_fichier = format_fichier
+        self._mot_de_passe = mot_de_passe.encode('utf-8') if isinstance(mot_de_passe, str) else mot_de_passe
+        # La vérification mathématique d'une clé RSA est l'essentiel du temps de chargement :
+        # on peut la sauter pour des clés que l'on a soi-même écrites dans ce dossier
+        self.verifier_cles = verifier_cles
+        self._memoire = {}
+        os.makedirs(dossier, exist_ok=True)
+
+    @staticmethod
+    def identifiant(cle_publique):
+        """
+        Identifiant d'une clé : SHA256 de la clé publique encodée en DER (hexadécimal).
+        """
+        der = cle_publique.public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        empreinte = hashes.Hash(hashes.SHA256())
+        empreinte.update(der)
+        return empreinte.finalize().hex()
+
+    def _chemin(self, id_cle):
+        # Un identifiant vient parfois d'un client (serveur.py) : seule une empreinte SHA256 en hexadécimal
+        # est acceptée, jamais un chemin ("../...") qui sortirait du dossier
+        if not isinstance(id_cle, str) or not _IDENTIFIANT.fullmatch(id_cle):
+            raise ValueError("Identifiant de clé invalide (64 caractères hexadécimaux attendus).")
+        return os.path.join(self.dossier, f"{id_cle}.{self.format_fichier}")
+
+    def enregistrer(self, cle_privee):
+        """
+        Sauvegarde une clé privée sur le disque.
+        Retourne : str → identifiant de la clé
+        """
+        id_cle = self.identifiant(cle_privee.public_key())
+        if self._mot_de_passe:
+            chiffrement = serialization.BestAvailableEncryption(self._mot_de_passe)
+        else:
+            chiffrement = serialization.NoEncryption()
+        encodage = serialization.Encoding.PEM if self.format_fichier == "pem" else serialization.Encoding.DER
+        donnees = cle_privee.private_bytes(
+            encoding=encodage,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=chiffrement
+        )
+        with open(self._chemin(id_cle), 'wb') as fichier:
+            fichier.write(donnees)
+        self._memoire[id_cle] = (cle_privee, cle_privee.public_key())
+        return id_cle
+
+    def charger(self, id_cle):
+        """
+        Recharge une clé à partir de son identifiant.
+        Retourne : (clé_privée, clé_publique)
+        """
+        if id_cle in self._memoire:
+            return self._memoire[id_cle]
+        chemin = self._chemin(id_cle)
+        if not os.path.exists(chemin):
+            raise ValueError(f"Clé inconnue : {id_cle}")
+        with open(chemin, 'rb') as fichier:
+            donnees = fichier.read()
+        charger_cle = (serialization.load_pem_private_key if self.format_fichier == "pem"
+                       else serialization.load_der_private_key)
+        if self.verifier_cles:
+            cle_privee = charger_cle(donnees, password=self._mot_de_passe)
+        else:
+            cle_privee = charger_cle(donnees, password=self._mot_de_passe, unsafe_skip_rsa_key_validation=True)
+        self._memoire[id_cle] = (cle_privee, cle_privee.public_key())
+        return self._memoire[id_cle]
+
+    def identifiants(self):
+        """
+        Liste des identifiants des clés présentes dans le dossier.
+        """
+        suffixe = "." + self.format_fichier
+        return sorted(nom[:-len(suffixe)] for nom in os.listdir(self.dossier) if nom.endswith(suffixe))
+
+
+# ====================== PADDING OAEP ======================
+# Ne contient que des paramètres : partagé par tous les appels.
+PADDING_OAEP = padding.OAEP(                          # Padding moderne et sécurisé
+    mgf=padding.MGF1(algorithm=hashes.SHA256()),      # Masque de génération (MGF1 avec SHA256)
+    algorithm=hashes.SHA256(),                        # Fonction de hachage utilisée
+    label=None                                        # Étiquette optionnelle (pas utilisée ici)
+)
+
+
 # ====================== CHIFFREMENT ======================
 def rsa_chiffrer(message, cle_publique):
     """
@@ -55,11 +263,7 @@ def rsa_chiffrer(message, cle_publique):
     # Chiffrement réel avec OAEP + SHA256 (le plus sécurisé aujourd'hui)
     ciphertext = cle_publique.encrypt(
         message,                                      # Données à chiffrer
-        padding.OAEP(                                 # Padding moderne et sécurisé
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),  # Masque de génération (MGF1 avec SHA256)
-            algorithm=hashes.SHA256(),           # Fonction de hachage utilisée
-            label=None                           # Étiquette optionnelle (pas utilisée ici)
-        )
+        PADDING_OAEP                                  # Padding OAEP + SHA256 (voir plus haut)
     )
     # Retourne le message chiffré sous forme de bytes (impossible à lire directement)
     return ciphertext
@@ -77,16 +281,229 @@ def rsa_dechiffrer(texte_chiffre, cle_privee):
     # Déchiffrement avec le même padding OAEP + SHA256 que pour le chiffrement
     plaintext = cle_privee.decrypt(
         texte_chiffre,                                # Message chiffré à déchiffrer
-        padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None
-        )
+        PADDING_OAEP
     )
     # On reconvertit les bytes en texte lisible (UTF-8)
     return plaintext.decode('utf-8')
 
 
+# ====================== TRAITEMENT PAR LOTS (plusieurs fils) ======================
+# OpenSSL libère le GIL pendant les opérations RSA : plusieurs fils d'exécution
+# travaillent donc vraiment en parallèle sur des milliers de petits messages.
+
+TAILLE_LOT_FILS = 32                                  # Messages traités d'affilée par un fil
+PAQUET_FILS = 4096                                    # Messages lus à la fois par les versions en flux (_iter)
+
+
+def _traiter_lot(fonction, lot, cle, collecter_erreurs):
+    resultats = []
+    for element in lot:
+        try:
+            resultats.append(fonction(element, cle))
+        except Exception as erreur:
+            if not collecter_erreurs:
+                raise
+            resultats.append(erreur)                  # L'erreur prend la place du résultat
+    return resultats
+
+
+def _iterer_lots(fonction, elements, cle, nb_fils, collecter_erreurs, taille_lot):
+    # Générateur : lit PAQUET_FILS éléments à la fois, les traite en lots sur le pool de fils,
+    # rend leurs résultats dans l'ordre, puis seulement lit le paquet suivant (mémoire bornée)
+    elements = iter(elements)
+    with ThreadPoolExecutor(max_workers=nb_fils) as executor:
+        while True:
+            paquet = list(itertools.islice(elements, PAQUET_FILS))
+            if not paquet:
+                return
+            lots = [paquet[i:i + taille_lot] for i in range(0, len(paquet), taille_lot)]
+            # executor.map rend les lots dans l'ordre d'entrée
+            for lot_traite in executor.map(lambda lot: _traiter_lot(fonction, lot, cle, collecter_erreurs), lots):
+                yield from lot_traite
+
+
+def rsa_chiffrer_lot(messages, cle_publique, nb_fils=None, collecter_erreurs=False, taille_lot=TAILLE_LOT_FILS):
+    """
+    Chiffre une liste (ou un itérable) de messages avec la même clé publique.
+    Paramètres :
+        messages          : itérable de str ou bytes
+        cle_publique      : objet clé publique RSA
+        nb_fils           : nombre de fils d'exécution (None = choix automatique)
+        collecter_erreurs : True → une erreur sur un message est mise à sa place dans le résultat
+                            au lieu d'interrompre tout le lot
+    Retourne : list → messages chiffrés (bytes), dans l'ordre d'entrée
+    """
+    return list(_iterer_lots(rsa_chiffrer, messages, cle_publique, nb_fils, collecter_erreurs, taille_lot))
+
+
+def rsa_chiffrer_iter(messages, cle_publique, nb_fils=None, collecter_erreurs=False, taille_lot=TAILLE_LOT_FILS):
+    """
+    Comme rsa_chiffrer_lot, mais générateur : les messages sont lus et chiffrés par paquets de PAQUET_FILS,
+    chaque résultat est rendu dès que son paquet est prêt. Mémoire bornée, même pour des millions de messages.
+    """
+    return _iterer_lots(rsa_chiffrer, messages, cle_publique, nb_fils, collecter_erreurs, taille_lot)
+
+
+def rsa_dechiffrer_lot(textes_chiffres, cle_privee, nb_fils=None, collecter_erreurs=False,
+                       taille_lot=TAILLE_LOT_FILS):
+    """
+    Déchiffre une liste (ou un itérable) de messages avec la même clé privée.
+    Paramètres :
+        textes_chiffres   : itérable de bytes (sorties de rsa_chiffrer)
+        cle_privee        : objet clé privée RSA
+        nb_fils           : nombre de fils d'exécution (None = choix automatique)
+        collecter_erreurs : True → une erreur sur un message est mise à sa place dans le résultat
+                            au lieu d'interrompre tout le lot
+    Retourne : list → messages en clair (str), dans l'ordre d'entrée
+    """
+    return list(_iterer_lots(rsa_dechiffrer, textes_chiffres, cle_privee, nb_fils, collecter_erreurs, taille_lot))
+
+
+def rsa_dechiffrer_iter(textes_chiffres, cle_privee, nb_fils=None, collecter_erreurs=False,
+                        taille_lot=TAILLE_LOT_FILS):
+    """
+    Comme rsa_dechiffrer_lot, mais générateur (voir rsa_chiffrer_iter).
+    """
+    return _iterer_lots(rsa_dechiffrer, textes_chiffres, cle_privee, nb_fils, collecter_erreurs, taille_lot)
+
+
+# ====================== MODE HYBRIDE (RSA-OAEP + AES-GCM) ======================
+# OAEP + SHA256 avec une clé 2048 bits ne peut chiffrer qu'environ 190 octets.
+# En mode hybride, RSA ne chiffre qu'une clé de session AES aléatoire (une seule opération RSA par message),
+# puis le message est chiffré avec AES-GCM par morceaux authentifiés : taille illimitée, mémoire constante.
+#
+# Format : "RSAH" | version (1 octet) | taille de la clé chiffrée (2) | clé de session chiffrée par OAEP
+#          | préfixe de nonce (8) | puis pour chaque morceau : taille (4) | morceau chiffré + tag GCM (16)
+# Chaque morceau est authentifié avec son numéro et un drapeau "dernier morceau" :
+# un fichier tronqué, réordonné ou modifié est refusé au déchiffrement.
+
+MAGIQUE_HYBRIDE = b"RSAH"
+VERSION_HYBRIDE = 1
+TAILLE_MORCEAU = 64 * 1024                       # Taille des morceaux de message chiffrés par AES-GCM
+_ENTETE_HYBRIDE = struct.Struct("!4sBH")
+_ENTETE_MORCEAU = struct.Struct("!I")
+TAILLE_TAG = 16                                  # Tag d'authentification GCM ajouté à chaque morceau
+
+
+def _donnees_associees(numero, dernier):
+    # Données authentifiées (non chiffrées) d'un morceau : son numéro et s'il est le dernier
+    return struct.pack("!QB", numero, 1 if dernier else 0)
+
+
+def rsa_chiffrer_flux(entree, sortie, cle_publique, taille_morceau=TAILLE_MORCEAU):
+    """
+    Chiffre en mode hybride tout le contenu d'un fichier ouvert en binaire.
+    Paramètres :
+        entree       : fichier (ou flux) binaire à lire
+        sortie       : fichier (ou flux) binaire où écrire le résultat
+        cle_publique : objet clé publique RSA
+    Retourne : int → nombre d'octets de message chiffrés
+    """
+    cle_session = AESGCM.generate_key(bit_length=256)     # Clé AES aléatoire, propre à ce message
+    aes = AESGCM(cle_session)
+    cle_chiffree = cle_publique.encrypt(cle_session, PADDING_OAEP)      # La SEULE opération RSA
+    prefixe_nonce = os.urandom(8)                          # Nonce = préfixe aléatoire + numéro du morceau
+
+    sortie.write(_ENTETE_HYBRIDE.pack(MAGIQUE_HYBRIDE, VERSION_HYBRIDE, len(cle_chiffree)))
+    sortie.write(cle_chiffree)
+    sortie.write(prefixe_nonce)
+
+    total = 0
+    numero = 0
+    morceau = entree.read(taille_morceau)
+    while True:
+        suivant = entree.read(taille_morceau) if morceau else b""   # Lecture en avance pour repérer le dernier
+        dernier = not suivant
+        nonce = prefixe_nonce + struct.pack("!I", numero)
+        chiffre = aes.encrypt(nonce, morceau, _donnees_associees(numero, dernier))
+        sortie.write(_ENTETE_MORCEAU.pack(len(chiffre)))
+        sortie.write(chiffre)
+        total += len(morceau)
+        if dernier:
+            return total
+        morceau = suivant
+        numero += 1
+
+
+def _lire_exactement(entree, taille):
+    # Lit `taille` octets ou lève ValueError : un fichier tronqué n'est jamais pris pour un fichier complet
+    donnees = entree.read(taille)
+    if len(donnees) != taille:
+        raise ValueError("Message chiffré tronqué.")
+    return donnees
+
+
+def rsa_dechiffrer_flux(entree, sortie, cle_privee, taille_morceau=TAILLE_MORCEAU):
+    """
+    Déchiffre un flux produit par rsa_chiffrer_flux et écrit le message clair dans `sortie`.
+    Paramètres :
+        entree         : fichier (ou flux) binaire chiffré
+        sortie         : fichier (ou flux) binaire où écrire le message clair
+        cle_privee     : objet clé privée RSA
+        taille_morceau : celle utilisée au chiffrement (un morceau plus grand est refusé)
+    Retourne : int → nombre d'octets déchiffrés
+    Lève ValueError si le message est invalide, modifié, tronqué ou chiffré pour une autre clé.
+    """
+    magique, version, taille_cle = _ENTETE_HYBRIDE.unpack(_lire_exactement(entree, _ENTETE_HYBRIDE.size))
+    if magique != MAGIQUE_HYBRIDE or version != VERSION_HYBRIDE:
+        raise ValueError("Ce n'est pas un message chiffré en mode hybride.")
+    cle_session = cle_privee.decrypt(_lire_exactement(entree, taille_cle), PADDING_OAEP)
+    aes = AESGCM(cle_session)
+    prefixe_nonce = _lire_exactement(entree, 8)
+    taille_max = taille_morceau + TAILLE_TAG     # Longueur non authentifiée : bornée avant toute lecture
+
+    total = 0
+    numero = 0
+    entete = _lire_exactement(entree, _ENTETE_MORCEAU.size)
+    while True:
+        longueur = _ENTETE_MORCEAU.unpack(entete)[0]
+        if longueur > taille_max:
+            raise ValueError("Morceau chiffré trop grand : message invalide ou modifié.")
+        chiffre = _lire_exactement(entree, longueur)
+        entete = entree.read(_ENTETE_MORCEAU.size)     # En-tête du morceau suivant (vide → dernier morceau)
+        dernier = not entete
+        if not dernier and len(entete) < _ENTETE_MORCEAU.size:
+            raise ValueError("Message chiffré tronqué.")
+        nonce = prefixe_nonce + struct.pack("!I", numero)
+        try:
+            clair = aes.decrypt(nonce, chiffre, _donnees_associees(numero, dernier))
+        except InvalidTag:
+            raise ValueError("Message chiffré modifié ou tronqué (authentification AES-GCM refusée).") from None
+        sortie.write(clair)
+        total += len(clair)
+        if dernier:
+            return total
+        numero += 1
+
+
+def rsa_chiffrer_hybride(message, cle_publique):
+    """
+    Chiffre un message de taille quelconque en mode hybride (RSA-OAEP + AES-GCM).
+    Paramètres :
+        message      : str ou bytes → texte à chiffrer
+        cle_publique : objet clé publique RSA
+    Retourne : bytes → message chiffré (format binaire)
+    """
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    sortie = io.BytesIO()
+    rsa_chiffrer_flux(io.BytesIO(message), sortie, cle_publique)
+    return sortie.getvalue()
+
+
+def rsa_dechiffrer_hybride(texte_chiffre, cle_privee):
+    """
+    Déchiffre un message produit par rsa_chiffrer_hybride.
+    Paramètres :
+        texte_chiffre : bytes → message chiffré
+        cle_privee    : objet clé privée RSA
+    Retourne : bytes → message en clair
+    """
+    sortie = io.BytesIO()
+    rsa_dechiffrer_flux(io.BytesIO(texte_chiffre), sortie, cle_privee)
+    return sortie.getvalue()
+
+
 # ====================== TEST AUTONOME ======================
 if __name__ == "__main__":
     # Ce code ne s'exécute que si on lance directement ce fichier : python rsa.py
@@ -111,4 +528,11 @@ if __name__ == "__main__":
 
     # Si tout est bon → on retrouve exactement le message original
     if texte_dechiffre_rsa == texte_clair:
-        print("\nSUCCÈS TOTAL : le message a été parfaitement chiffré et déchiffré !")
\ No newline at end of file
+        print("\nSUCCÈS TOTAL : le message a été parfaitement chiffré et déchiffré !")
+
+    # === Mode hybride : message trop long pour OAEP seul ===
+    texte_long = texte_clair * 10000
+    print(f"\nMode hybride (RSA-OAEP + AES-GCM) sur {len(texte_long)} caractères...")
+    texte_chiffre_hybride = rsa_chiffrer_hybride(texte_long, cle_publique_rsa)
+    texte_dechiffre_hybride = rsa_dechiffrer_hybride(texte_chiffre_hybride, cle_privee_rsa).decode('utf-8')
+    print("Succès !" if texte_dechiffre_hybride == texte_long else "Échec")
\ No newline at end of file
@@ -2,7 +2,11 @@
 # Module implémentant un RSA  fait main (sans bibliothèque externe)
 
 import math                   
+import os
 import random                  # Pour choisir aléatoirement la clé publique e
+import secrets                 # Hasard cryptographique pour générer p et q automatiquement
+import struct                  # Pour l'en-tête du format binaire des messages chiffrés
+from itertools import repeat
 
 
 # ====================== VÉRIFICATION SI UN NOMBRE EST PREMIER ======================
@@ -21,10 +25,98 @@ def est_premier(n):
     while i * i <= n:                           # On teste jusqu'à la racine carrée de n
         if n % i == 0 or n % (i + 2) == 0:       # On teste i et i+2 (ex: 5,7 puis 11,13...)
             return False                        # Si divisible → pas premier
+        if i > LIMITE_DIVISION:                  # Nombre trop grand pour la division → Miller–Rabin
+            return est_probablement_premier(n)
         i += 6                                  # On passe au prochain couple (6k±1)
     return True                                 # Si aucun diviseur trouvé → c'est premier !
 
 
+# ====================== CRIBLE DES PETITS PREMIERS ======================
+def crible(limite):
+
+    # Crible d'Ératosthène : liste de tous les nombres premiers <= limite
+
+    est_p = bytearray([1]) * (limite + 1)
+    est_p[0:2] = b"\x00\x00"                    # 0 et 1 ne sont pas premiers
+    for i in range(2, math.isqrt(limite) + 1):
+        if est_p[i]:
+            est_p[i * i::i] = bytes(len(range(i * i, limite + 1, i)))   # On raye les multiples de i
+    return [i for i in range(limite + 1) if est_p[i]]
+
+
+LIMITE_DIVISION = 1 << 16                       # Au-delà de 65536² on passe à Miller–Rabin
+PETITS_PREMIERS = crible(2000)                  # Filtre rapide avant Miller–Rabin
+# Ces 12 bases rendent Miller–Rabin EXACT pour tout n < 3,3·10^24 (donc pour tout n < 2^64)
+BASES_DETERMINISTES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+TOURS_MILLER_RABIN = 40                         # Au-delà de 2^64 : erreur < 4^-40
+
+
+# ====================== TEST DE MILLER–RABIN ======================
+def miller_rabin(n, bases):
+
+    # Retourne False si une des bases prouve que n est composé, True sinon
+
+    d, s = n - 1, 0
+    while d % 2 == 0:                           # On écrit n - 1 = d × 2^s avec d impair
+        d //= 2
+        s += 1
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):                  # On élève au carré jusqu'à trouver n - 1
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False                        # a est un "témoin" : n est composé
+    return True
+
+
+def est_probablement_premier(n):
+
+    # Petits premiers d'abord (très rapide), puis Miller–Rabin :
+    # déterministe si n < 2^64, probabiliste (bases aléatoires) au-delà
+
+    if n < 2:
+        return False
+    for p in PETITS_PREMIERS:
+        if n % p == 0:
+            return n == p
+    if n < PETITS_PREMIERS[-1] ** 2:            # Aucun petit diviseur et n < 2000² → premier
+        return True
+    if n < (1 << 64):
+        return miller_rabin(n, BASES_DETERMINISTES)
+    bases = [secrets.randbelow(n - 3) + 2 for _ in range(TOURS_MILLER_RABIN)]
+    return miller_rabin(n, bases)
+
+
+# ====================== GÉNÉRATION D'UN GRAND PREMIER ======================
+def generer_premier(bits):
+
+    # Tire un nombre impair de `bits` bits puis cherche le premier suivant par pas de 2.
+    # Les restes modulo les petits premiers sont calculés UNE fois, puis mis à jour par simple addition :
+    # la plupart des candidats sont éliminés sans aucune exponentiation modulaire.
+
+    if bits < 16:
+        raise ValueError("Un premier doit faire au moins 16 bits.")
+    crible_premiers = PETITS_PREMIERS[1:]        # 2 est inutile : les candidats sont impairs
+    while True:
+        # Les deux bits de poids fort à 1 → p × q aura exactement 2 × bits bits
+        depart = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        restes = [depart % p for p in crible_premiers]
+        for ecart in range(0, 20 * bits, 2):   # Recherche incrémentale
+            candidat = depart + ecart
+            if candidat.bit_length() != bits:
+                break                           # On a débordé → nouveau tirage
+            if all((r + ecart) % p for r, p in zip(restes, crible_premiers)):
+                if est_probablement_premier(candidat):
+                    return candidat
+
+
 # ====================== PGCD (Plus Grand Commun Diviseur) - Algorithme d'Euclide ======================
 def pgcd(a, b):
     
@@ -64,6 +156,186 @@ def mod_inverse(a, m):
     return x1 + m0 if x1 < 0 else x1            # On rend d positif
 
 
+# ====================== CLÉ PRIVÉE AVEC THÉORÈME DES RESTES CHINOIS ======================
+class ClePriveeRSA:
+
+    # Clé privée compacte (__slots__) qui garde p et q pour accélérer le déchiffrement.
+    # Au lieu de c^d mod n, on calcule deux exponentiations modulo p et q (nombres deux fois plus petits,
+    # exposants deux fois plus courts) puis on recombine avec le théorème des restes chinois (≈ 3 à 4 fois plus rapide).
+    # RSA multi-premiers (n = p × q × r3 × r4) : autres_premiers = (r3, r4). Chaque premier supplémentaire r
+    # a son exposant d mod (r - 1) et son coefficient t = (p × q × ...)^-1 mod r (PKCS #1, RFC 8017) :
+    # plus les premiers sont petits, moins chaque exponentiation coûte (≈ 2 fois plus rapide à 3 premiers, ≈ 3 fois à 4).
+    # Reste utilisable comme l'ancien tuple : d, n = cle_privee
+
+    __slots__ = ("d", "n", "p", "q", "dp", "dq", "qinv", "autres")
+
+    def __init__(self, d, p, q, autres_premiers=()):
+        self.d = d
+        self.n = p * q
+        self.p = p
+        self.q = q
+        self.dp = d % (p - 1)                   # Exposant réduit modulo p - 1
+        self.dq = d % (q - 1)                   # Exposant réduit modulo q - 1
+        self.qinv = mod_inverse(q, p)           # q^-1 mod p pour la recombinaison
+        autres = []                             # [(r, d mod (r - 1), coefficient t), ...]
+        for r in autres_premiers:
+            autres.append((r, d % (r - 1), mod_inverse(self.n % r, r)))
+            self.n *= r
+        self.autres = tuple(autres)
+
+    def __iter__(self):                         # Permet d, n = cle_privee (compatibilité)
+        return iter((self.d, self.n))
+
+    def __repr__(self):
+        return f"ClePriveeRSA(d={self.d}, n={self.n}, premiers={len(self.premiers)})"
+
+    @property
+    def premiers(self):
+        return (self.p, self.q) + tuple(r for r, _, _ in self.autres)
+
+    def dechiffrer_entier(self, c):
+        m1 = pow(c % self.p, self.dp, self.p)   # m mod p
+        m2 = pow(c % self.q, self.dq, self.q)   # m mod q
+        h = self.qinv * (m1 - m2) % self.p      # Recombinaison (formule de Garner)
+        m = m2 + h * self.q
+        if self.autres:
+            produit = self.p * self.q           # m est déjà juste modulo p × q...
+            for r, dr, t in self.autres:
+                mr = pow(c % r, dr, r)          # ...on ajoute un premier à la fois (Garner généralisé)
+                m += produit * ((mr - m) * t % r)
+                produit *= r
+        return m
+
+
+# ====================== VÉRIFICATION D'UN ENSEMBLE DE PREMIERS ======================
+MAX_PREMIERS = 4                                # Au-delà, les premiers deviennent trop petits (factorisation par ECM)
+
+
+def rsa_verifier_premiers(premiers, e=None):
+
+    # Vérifie les premiers d'une clé (2 à MAX_PREMIERS) : tous distincts, tous premiers (Miller–Rabin),
+    # et e inversible modulo chaque r - 1. Lève ValueError sinon.
+
+    if not 2 <= len(premiers) <= MAX_PREMIERS:
+        raise ValueError(f"Une clé RSA utilise de 2 à {MAX_PREMIERS} premiers (reçu : {len(premiers)}).")
+    if len(set(premiers)) != len(premiers):
+        raise ValueError("Les premiers d'une clé RSA doivent être distincts.")
+    for r in premiers:
+        if r < 3 or not est_probablement_premier(r):
+            raise ValueError(f"{r} n'est pas un nombre premier impair.")
+        if e is not None and pgcd(e, r - 1) != 1:
+            raise ValueError(f"e n'est pas premier avec {r} - 1.")
+
+
+# ====================== CLÉS À PARTIR DE p ET q ======================
+def rsa_cles_depuis_premiers(p, q, e=None, autres_premiers=()):
+
+    # Calcule n, φ(n), e (aléatoire si non fourni) et d à partir de deux premiers distincts
+    # (ou plus : autres_premiers pour une clé multi-premiers)
+    # Retourne : (clé publique (e, n), clé privée ClePriveeRSA — se déballe comme (d, n))
+
+    premiers = (p, q) + tuple(autres_premiers)
+    if autres_premiers:
+        rsa_verifier_premiers(premiers, e)
+    n = math.prod(premiers)                     # Module commun aux deux clés
+    phi_n = math.prod(r - 1 for r in premiers)  # Fonction d'Euler φ(n)
+    if e is None:
+        e = generer_e(phi_n)                    # Clé publique (choisie aléatoirement)
+    elif pgcd(e, phi_n) != 1:
+        raise ValueError("e n'est pas premier avec φ(n).")
+    d = mod_inverse(e, phi_n)                   # Clé privée (calculée)
+    return (e, n), ClePriveeRSA(d, p, q, autres_premiers)
+
+
+# ====================== GÉNÉRATION AUTOMATIQUE (sans saisie) ======================
+def rsa_generer_cles_auto(bits=2048, e=65537, nombre_premiers=2):
+
+    # Génère une paire de clés RSA de `bits` bits sans rien demander à l'utilisateur :
+    # les premiers sont tirés au hasard (crible + Miller–Rabin). e = None → e aléatoire comme en mode pédagogique.
+    # nombre_premiers = 3 ou 4 → RSA multi-premiers : n a toujours `bits` bits, mais le déchiffrement est plus rapide.
+
+    if bits < 32:
+        raise ValueError("La taille de clé doit être d'au moins 32 bits.")
+    if not 2 <= nombre_premiers <= MAX_PREMIERS:
+        raise ValueError(f"Une clé RSA utilise de 2 à {MAX_PREMIERS} premiers.")
+    if bits // nombre_premiers < 16:
+        raise ValueError(f"Clé trop petite pour {nombre_premiers} premiers.")
+    # Tailles des premiers : bits répartis au mieux (le premier reçoit le reste)
+    tailles = [bits // nombre_premiers] * nombre_premiers
+    tailles[0] += bits - sum(tailles)
+    while True:
+        premiers = [generer_premier(taille) for taille in tailles]
+        if len(set(premiers)) != nombre_premiers:
+            continue
+        if math.prod(premiers).bit_length() != bits:
+            continue                            # À partir de 3 premiers, n peut avoir un bit de moins
+        if e is not None and any(pgcd(e, r - 1) != 1 for r in premiers):
+            continue                            # e doit être inversible modulo φ(n) → on retire les premiers
+        return rsa_cles_depuis_premiers(premiers[0], premiers[1], e, premiers[2:])
+
+
+# ====================== ENREGISTREMENT DES CLÉS (fichier JSON) ======================
+def rsa_enregistrer_cle(chemin, cle, privee=False):
+
+    # Écrit une clé dans un fichier JSON :
+    #   clé publique (e, n)     → {"e": ..., "n": ...}
+    #   ClePriveeRSA            → {"d": ..., "n": ..., "p": ..., "q": ...} (restes chinois au rechargement)
+    #     + multi-premiers      → "autres_premiers": [{"r": ..., "d": ..., "t": ...}, ...]
+    #                             (premier, exposant d mod (r - 1), coefficient t, comme OtherPrimeInfo de PKCS #1)
+    #   clé privée (d, n) seule → {"d": ..., "n": ...} (privee=True)
+
+    import json                                 # Import ici : inutile tant qu'on n'enregistre pas de clé
+
+    if isinstance(cle, ClePriveeRSA):
+        contenu = {"d": cle.d, "n": cle.n, "p": cle.p, "q": cle.q}
+        if cle.autres:
+            contenu["autres_premiers"] = [{"r": r, "d": dr, "t": t} for r, dr, t in cle.autres]
+    elif privee:
+        d, n = cle
+        contenu = {"d": d, "n": n}
+    else:
+        e, n = cle
+        contenu = {"e": e, "n": n}
+    with open(chemin, 'w', encoding='utf-8') as fichier:
+        json.dump(contenu, fichier, indent=2)
+
+
+def rsa_cle_depuis_dict(contenu):
+
+    # Dictionnaire au format de rsa_enregistrer_cle (fichier JSON, requête du serveur...) → clé sous sa forme d'origine.
+    # Une clé privée avec p et q est vérifiée : produit égal à n, et pour une clé multi-premiers,
+    # premiers valides, exposants et coefficients cohérents. Lève ValueError sinon.
+
+    if "p" in contenu:
+        autres = contenu.get("autres_premiers", [])
+        cle = ClePriveeRSA(contenu["d"], contenu["p"], contenu["q"], [info["r"] for info in autres])
+        if autres:
+            rsa_verifier_premiers(cle.premiers)
+            if cle.autres != tuple((i["r"], i["d"], i["t"]) for i in autres):
+                raise ValueError("Clé multi-premiers incohérente (exposants ou coefficients).")
+        if cle.n != contenu.get("n", cle.n):
+            raise ValueError("Clé privée incohérente : le produit des premiers n'est pas égal à n.")
+        return cle
+    if "d" in contenu:
+        return (contenu["d"], contenu["n"])
+    return (contenu["e"], contenu["n"])
+
+
+def rsa_charger_cle(chemin):
+
+    # Relit un fichier écrit par rsa_enregistrer_cle et retourne la clé sous sa forme d'origine
+    # (vérifiée par rsa_cle_depuis_dict).
+
+    import json
+
+    with open(chemin, encoding='utf-8') as fichier:
+        contenu = json.load(fichier)
+    try:
+        return rsa_cle_depuis_dict(contenu)
+    except ValueError as erreur:
+        raise ValueError(f"{erreur} ({chemin})") from None
+
+
 # ====================== GÉNÉRATION COMPLÈTE DES CLÉS RSA ======================
 def rsa_generer_cles():
     print("\n=== Génération des clés RSA (version pédagogique) ===")
@@ -95,25 +367,63 @@ def rsa_generer_cles():
         except ValueError:
             print("Entrez un nombre entier valide.")
 
-    # --- Calculs mathématiques de base du RSA ---
-    n = p * q                                   # Module commun aux deux clés
-    phi_n = (p - 1) * (q - 1)                   # Fonction d'Euler φ(n)
-    e = generer_e(phi_n)                        # Clé publique (choisie aléatoirement)
-    d = mod_inverse(e, phi_n)                   # Clé privée (calculée)
+    # --- Calculs mathématiques de base du RSA (partagés avec la génération automatique) ---
+    cle_publique, cle_privee = rsa_cles_depuis_premiers(p, q)
+    e, n = cle_publique
+    d = cle_privee.d
 
     # --- Affichage clair des résultats ---
     print(f"\nClés générées avec succès !")
     print(f"n  = p × q       = {n}")
-    print(f"φ(n)             = {phi_n}")
+    print(f"φ(n)             = {(p - 1) * (q - 1)}")
     print(f"Clé publique  (e, n)  = ({e}, {n})")
     print(f"Clé privée    (d, n)  = ({d}, {n})")
 
     # On retourne seulement les deux clés nécessaires pour chiffrer/déchiffrer
-    return (e, n), (d, n)
+    return cle_publique, cle_privee
+
+
+# ====================== CALCUL PARALLÈLE DES BLOCS ======================
+SEUIL_PARALLELE = 256                           # En dessous, démarrer des processus coûte plus cher que le calcul
+TAILLE_LOT = 64                                 # Nombre de blocs envoyés à un processus en une fois
+
+
+def _lot_chiffrer(lot, e, n):
+    # Exécuté dans un processus : chiffre une liste de blocs
+    return [pow(m, e, n) for m in lot]
+
+
+def _lot_dechiffrer(lot, cle_privee):
+    # Exécuté dans un processus : déchiffre une liste de blocs
+    dechiffrer_bloc = _fonction_dechiffrement(cle_privee)
+    return [dechiffrer_bloc(c) for c in lot]
+
+
+def _calculer_blocs(fonction_lot, blocs, parametres, processus, taille_lot):
+
+    # Applique fonction_lot(lot, *parametres) à tous les blocs, en série ou sur un pool de processus.
+    # Les blocs sont indépendants : chaque processus reçoit des lots de taille_lot blocs,
+    # et executor.map rend les résultats dans l'ordre d'origine.
+
+    if processus is None:
+        processus = os.cpu_count() or 1
+    if processus <= 1 or len(blocs) < SEUIL_PARALLELE:
+        return fonction_lot(blocs, *parametres)     # Petit message → série, pas de coût de démarrage
+
+    # Import ici : concurrent.futures + multiprocessing coûtent ~25 ms, inutiles en série
+    from concurrent.futures import ProcessPoolExecutor
+
+    lots = [blocs[i:i + taille_lot] for i in range(0, len(blocs), taille_lot)]
+    resultat = []
+    with ProcessPoolExecutor(max_workers=processus) as executor:
+        for lot_calcule in executor.map(fonction_lot, lots, *(repeat(p) for p in parametres)):
+            resultat.extend(lot_calcule)
+    return resultat
 
 
 # ====================== CHIFFREMENT PAR BLOCS (pour messages longs) ======================
-def rsa_chiffrer(message, cle_publique):
+def rsa_chiffrer(message, cle_publique, processus=1, taille_lot=TAILLE_LOT):
+    # processus > 1 (ou None = tous les cœurs) → blocs chiffrés en parallèle pour les longs messages
     e, n = cle_publique                         # On récupère e et n de la clé publique
     if isinstance(message, str):                # Si c'est du texte
         message_bytes = message.encode('utf-8') # On le convertit en bytes
@@ -123,31 +433,195 @@ def rsa_chiffrer(message, cle_publique):
     # On calcule la taille maximale d'un bloc (en bytes) que n peut contenir
     bloc_size = (n.bit_length() - 1) // 8       # -1 pour éviter les dépassements
 
-    blocs_chiffres = []                         # Liste qui contiendra tous les blocs chiffrés
+    blocs_clairs = []                           # Liste des blocs convertis en grands nombres
     for i in range(0, len(message_bytes), bloc_size):  # On découpe en blocs
         bloc = message_bytes[i:i + bloc_size]   # On prend un morceau du message
         m = int.from_bytes(bloc, 'big')         # On convertit ce morceau en grand nombre
-        c = pow(m, e, n)                        # CHIFFREMENT : c = m^e mod n (magie de Python !)
-        blocs_chiffres.append(c)                # On stocke le bloc chiffré
+        blocs_clairs.append(m)
+
+    # CHIFFREMENT : c = m^e mod n pour chaque bloc (magie de Python !)
+    blocs_chiffres = _calculer_blocs(_lot_chiffrer, blocs_clairs, (e, n), processus, taille_lot)
 
     return blocs_chiffres                       # On retourne la liste complète
 
 
 # ====================== DÉCHIFFREMENT ======================
-def rsa_dechiffrer(blocs_chiffres, cle_privee):
+def _fonction_dechiffrement(cle_privee):
+    # Clé ClePriveeRSA → restes chinois ; simple tuple (d, n) → exponentiation complète
+    if isinstance(cle_privee, ClePriveeRSA):
+        return cle_privee.dechiffrer_entier
+    d, n = cle_privee
+    return lambda c: pow(c, d, n)
+
+
+def rsa_dechiffrer(blocs_chiffres, cle_privee, processus=1, taille_lot=TAILLE_LOT):
+    # processus > 1 (ou None = tous les cœurs) → blocs déchiffrés en parallèle pour les longs messages
     d, n = cle_privee                           # On récupère d et n de la clé privée
-    message_bytes = b""                         # Chaîne binaire qui va reconstruire le message
+    bloc_size = (n.bit_length() - 1) // 8       # Même taille de bloc qu'au chiffrement
+    blocs_chiffres = list(blocs_chiffres)
+    # DÉCHIFFREMENT : m = c^d mod n pour chaque bloc
+    blocs_clairs = _calculer_blocs(_lot_dechiffrer, blocs_chiffres, (cle_privee,), processus, taille_lot)
+    morceaux = []                               # Liste de morceaux + join → coût linéaire
 
-    for c in blocs_chiffres:                    # Pour chaque bloc chiffré
-        m = pow(c, d, n)                        # DÉCHIFFREMENT : m = c^d mod n
-        byte_len = (m.bit_length() + 7) // 8    # On calcule combien de bytes il faut
-        bloc_bytes = m.to_bytes(byte_len, 'big')  # On reconvertit le nombre en bytes
-        message_bytes += bloc_bytes             # On ajoute au message final
+    for i, m in enumerate(blocs_clairs):        # Pour chaque bloc déchiffré
+        if i < len(blocs_chiffres) - 1:
+            # Tous les blocs sauf le dernier font exactement bloc_size octets :
+            # on garde leurs zéros de tête au lieu de les perdre avec bit_length()
+            byte_len = bloc_size
+        else:
+            byte_len = (m.bit_length() + 7) // 8    # Dernier bloc : taille inconnue dans une simple liste
+        morceaux.append(m.to_bytes(byte_len, 'big'))  # On reconvertit le nombre en bytes
+    message_bytes = b"".join(morceaux)          # On assemble le message final
 
     # On reconvertit tout en texte lisible
     return message_bytes.decode('utf-8', errors='ignore').rstrip('\x00')
 
 
+# ====================== FORMAT BINAIRE DES MESSAGES CHIFFRÉS ======================
+# En-tête : "RSAB" | version (1 octet) | taille bloc clair (4) | taille bloc chiffré (4) | longueur du message (8)
+# Puis tous les blocs chiffrés à la suite, chacun sur exactement "taille bloc chiffré" octets (big-endian).
+# Contrairement à la liste d'entiers, la longueur exacte du message est connue : rien n'est perdu au déchiffrement.
+
+FORMAT_ENTETE = struct.Struct("!4sBIIQ")
+MAGIQUE = b"RSAB"
+VERSION_FORMAT = 1
+BLOCS_PAR_LECTURE = 1024                        # Nombre de blocs lus à la fois dans un fichier
+
+
+def _tailles_blocs(n):
+    # (taille d'un bloc clair, taille d'un bloc chiffré) en octets
+    return (n.bit_length() - 1) // 8, (n.bit_length() + 7) // 8
+
+
+def _lire_entete(donnees, n):
+    # En-tête vérifié : format reconnu, et tailles de blocs égales à celles de la clé (module n)
+    if len(donnees) < FORMAT_ENTETE.size:
+        raise ValueError("Ce n'est pas un message chiffré RSA au format binaire.")
+    magique, version, taille_clair, taille_chiffre, longueur = FORMAT_ENTETE.unpack_from(donnees)
+    if magique != MAGIQUE or version != VERSION_FORMAT:
+        raise ValueError("Ce n'est pas un message chiffré RSA au format binaire.")
+    if (taille_clair, taille_chiffre) != _tailles_blocs(n):
+        raise ValueError("Ce message n'a pas été chiffré pour cette clé.")
+    return taille_clair, taille_chiffre, longueur
+
+
+def _chiffrer_dans(vue_sortie, vue_clair, e, n, taille_clair, taille_chiffre):
+    # Chiffre tous les blocs de vue_clair et les écrit directement dans vue_sortie (pas de concaténation)
+    position = 0
+    for i in range(0, len(vue_clair), taille_clair):
+        m = int.from_bytes(vue_clair[i:i + taille_clair], 'big')
+        vue_sortie[position:position + taille_chiffre] = pow(m, e, n).to_bytes(taille_chiffre, 'big')
+        position += taille_chiffre
+    return position
+
+
+def _dechiffrer_dans(vue_sortie, vue_chiffre, dechiffrer_bloc, taille_clair, taille_chiffre):
+    # Déchiffre tous les blocs de vue_chiffre ; chaque bloc clair reprend sa taille exacte
+    # (celle de la place qui lui reste dans vue_sortie), zéros de tête compris
+    position = 0
+    for i in range(0, len(vue_chiffre), taille_chiffre):
+        taille = min(taille_clair, len(vue_sortie) - position)
+        m = dechiffrer_bloc(int.from_bytes(vue_chiffre[i:i + taille_chiffre], 'big'))
+        if m >> (8 * taille):                   # Plus grand que le bloc clair : jamais produit par le chiffrement
+            raise ValueError("Bloc chiffré invalide ou mauvaise clé.")
+        vue_sortie[position:position + taille] = m.to_bytes(taille, 'big')
+        position += taille
+    return position
+
+
+def rsa_chiffrer_binaire(message, cle_publique):
+
+    # Chiffre un message (str ou bytes) et retourne un seul bloc binaire : en-tête + blocs de taille fixe.
+
+    e, n = cle_publique
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    taille_clair, taille_chiffre = _tailles_blocs(n)
+    nb_blocs = -(-len(message) // taille_clair)     # Division arrondie au supérieur
+
+    # Tampon alloué une seule fois, rempli par tranches de memoryview
+    sortie = bytearray(FORMAT_ENTETE.size + nb_blocs * taille_chiffre)
+    FORMAT_ENTETE.pack_into(sortie, 0, MAGIQUE, VERSION_FORMAT, taille_clair, taille_chiffre, len(message))
+    with memoryview(sortie) as vue:
+        _chiffrer_dans(vue[FORMAT_ENTETE.size:], memoryview(message), e, n, taille_clair, taille_chiffre)
+    return bytes(sortie)
+
+
+def rsa_dechiffrer_binaire(donnees, cle_privee):
+
+    # Déchiffre la sortie de rsa_chiffrer_binaire et retourne le message EXACT (bytes), en temps linéaire.
+
+    _, n = cle_privee
+    taille_clair, taille_chiffre, longueur = _lire_entete(donnees, n)
+    if len(donnees) != FORMAT_ENTETE.size + -(-longueur // taille_clair) * taille_chiffre:
+        raise ValueError("Message chiffré tronqué ou de longueur incorrecte.")
+    sortie = bytearray(longueur)
+    with memoryview(sortie) as vue:
+        _dechiffrer_dans(vue, memoryview(donnees)[FORMAT_ENTETE.size:],
+                         _fonction_dechiffrement(cle_privee), taille_clair, taille_chiffre)
+    return bytes(sortie)
+
+
+def rsa_chiffrer_flux(entree, sortie, cle_publique, longueur=None):
+
+    # Chiffre un fichier ouvert en binaire vers le format binaire, par lots de blocs (mémoire constante).
+    # L'en-tête contient la longueur du message : sans `longueur`, l'entrée doit permettre seek().
+
+    e, n = cle_publique
+    taille_clair, taille_chiffre = _tailles_blocs(n)
+    if longueur is None:
+        position = entree.tell()
+        longueur = entree.seek(0, os.SEEK_END) - position
+        entree.seek(position)
+    tampon = bytearray(BLOCS_PAR_LECTURE * taille_chiffre)   # Réutilisé à chaque lot
+    sortie.write(FORMAT_ENTETE.pack(MAGIQUE, VERSION_FORMAT, taille_clair, taille_chiffre, longueur))
+    with memoryview(tampon) as vue:
+        while True:
+            clair = entree.read(BLOCS_PAR_LECTURE * taille_clair)
+            if not clair:
+                break
+            ecrit = _chiffrer_dans(vue, memoryview(clair), e, n, taille_clair, taille_chiffre)
+            sortie.write(vue[:ecrit])
+
+
+def rsa_dechiffrer_flux(entree, sortie, cle_privee):
+
+    # Déchiffre un fichier ouvert en binaire produit par rsa_chiffrer_flux (ou rsa_chiffrer_binaire),
+    # en mémoire constante.
+
+    _, n = cle_privee
+    dechiffrer_bloc = _fonction_dechiffrement(cle_privee)
+    taille_clair, taille_chiffre, restant = _lire_entete(entree.read(FORMAT_ENTETE.size), n)
+    tampon = bytearray(BLOCS_PAR_LECTURE * taille_clair)
+    with memoryview(tampon) as vue:
+        while restant > 0:
+            taille_lot = min(len(tampon), restant)
+            attendu = -(-taille_lot // taille_clair) * taille_chiffre    # Exactement les blocs de ce lot
+            chiffre = entree.read(attendu)
+            if len(chiffre) != attendu:
+                raise ValueError("Fichier chiffré tronqué.")
+            ecrit = _dechiffrer_dans(vue[:taille_lot], memoryview(chiffre), dechiffrer_bloc,
+                                     taille_clair, taille_chiffre)
+            sortie.write(vue[:ecrit])
+            restant -= ecrit
+
+
+def rsa_chiffrer_fichier(chemin_entree, chemin_sortie, cle_publique):
+
+    # Chiffre un fichier vers le format binaire (voir rsa_chiffrer_flux).
+
+    with open(chemin_entree, 'rb') as entree, open(chemin_sortie, 'wb') as sortie:
+        rsa_chiffrer_flux(entree, sortie, cle_publique, os.path.getsize(chemin_entree))
+
+
+def rsa_dechiffrer_fichier(chemin_entree, chemin_sortie, cle_privee):
+
+    # Déchiffre un fichier produit par rsa_chiffrer_fichier (ou rsa_chiffrer_binaire).
+
+    with open(chemin_entree, 'rb') as entree, open(chemin_sortie, 'wb') as sortie:
+        rsa_dechiffrer_flux(entree, sortie, cle_privee)
+
+
 
 
 
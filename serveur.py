@@ -0,0 +1,324 @@
+# serveur.py
+# Service de chiffrement local (asyncio) : César, Vigénère, RSA fait main et RSA OAEP
+#
+# Protocole : TCP, une requête JSON par ligne, une réponse JSON par ligne (dans l'ordre de fin de traitement,
+# l'identifiant "id" permet de retrouver la requête) :
+#   → {"id": 1, "algorithme": "cesar", "operation": "chiffrer", "cle": 3, "message": "Bonjour"}
+#   ← {"id": 1, "resultat": "Erqmrxu"}
+#   ← {"id": 2, "erreur": "..."}
+# Clés : entier (cesar), mot (vigenere), dictionnaire au format de rsa_enregistrer_cle (rsa),
+# identifiant d'une clé du dossier --dossier-cles-oaep (rsa-oaep, voir CacheCles).
+# En RSA, les messages chiffrés circulent en hexadécimal.
+#
+# Utilisation :
+#   python serveur.py servir --port 8765
+#   python serveur.py charger --port 8765 --connexions 20 --requetes 20000 --algorithme vigenere
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import cesar
+import vigenere
+import rsa
+import registre
+
+DELAI_LOT = 0.002                   # Attente maximale (s) pour regrouper des requêtes avant de les traiter
+TAILLE_LOT_MAX = 256                # Un lot plein est traité immédiatement
+MAX_EN_COURS = 1024                 # Requêtes en cours au maximum (au-delà, on arrête de lire les sockets)
+TAILLE_LIGNE_MAX = 64 << 20         # Taille maximale d'une requête (64 Mo)
+ALGORITHMES = ("cesar", "vigenere", "rsa", "rsa-oaep")
+OPERATIONS = ("chiffrer", "dechiffrer")
+
+_cache_oaep = None                  # CacheCles des clés OAEP du serveur
+
+
+def _est_hexadecimal(texte):
+    try:
+        bytes.fromhex(texte)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+# ====================== TRAITEMENT D'UN LOT ======================
+def traiter_lot(algorithme, operation, cle, messages):
+    """
+    Traite un lot de messages qui partagent le même algorithme, la même opération et la même clé.
+    Exécuté dans un exécuteur (fil ou processus) : la boucle asyncio n'est jamais bloquée.
+    Retourne une liste de (True, résultat) ou (False, message d'erreur), dans l'ordre des messages.
+    """
+    chiffrer = operation == "chiffrer"
+
+    if algorithme == "rsa-oaep":
+        if _cache_oaep is None:
+            raise ValueError("Aucun dossier de clés OAEP configuré (--dossier-cles-oaep).")
+        module = registre.charger_rsa_auto()
+        cle_privee, cle_publique = _cache_oaep.charger(cle)
+        if chiffrer:
+            resultats = module.rsa_chiffrer_lot(messages, cle_publique, collecter_erreurs=True)
+        else:
+            # Un texte hexadécimal invalide devient b"" : OAEP le refusera, pour ce message seulement
+            donnees = [bytes.fromhex(m) if _est_hexadecimal(m) else b"" for m in messages]
+            resultats = module.rsa_dechiffrer_lot(donnees, cle_privee, collecter_erreurs=True)
+        return [(False, str(r)) if isinstance(r, Exception) else (True, r.hex() if chiffrer else r)
+                for r in resultats]
+
+    if algorithme == "cesar":
+        cle = int(cle)
+        fonction = cesar.cesar_chiffrer if chiffrer else cesar.cesar_dechiffrer
+    elif algorithme == "vigenere":
+        fonction = vigenere.vigenere_chiffrer if chiffrer else vigenere.vigenere_dechiffrer
+    else:
+        cle = rsa.rsa_cle_depuis_dict(cle)     # Même format que rsa_enregistrer_cle (multi-premiers compris)
+        if chiffrer:
+            fonction = lambda m, c: rsa.rsa_chiffrer_binaire(m, c).hex()
+        else:
+            fonction = lambda m, c: rsa.rsa_dechiffrer_binaire(bytes.fromhex(m), c).decode('utf-8')
+
+    resultats = []
+    for message in messages:
+        try:
+            resultats.append((True, fonction(message, cle)))
+        except Exception as erreur:
+            resultats.append((False, str(erreur)))
+    return resultats
+
+
+# ====================== REGROUPEMENT DES REQUÊTES (micro-lots) ======================
+class Ordonnanceur:
+    """
+    Regroupe les requêtes concurrentes par (algorithme, opération, clé).
+    Un lot part dès qu'il est plein, ou au plus tard `delai_lot` secondes après sa première requête.
+    Le RSA fait main (calcul Python pur) part dans un pool de processus, le reste dans un pool de fils.
+    """
+
+    def __init__(self, processus=None, fils=None, delai_lot=DELAI_LOT, taille_lot_max=TAILLE_LOT_MAX):
+        self.delai_lot = delai_lot
+        self.taille_lot_max = taille_lot_max
+        self._executeur_fils = ThreadPoolExecutor(max_workers=fils)
+        self._executeur_processus = ProcessPoolExecutor(max_workers=processus)
+        self._en_attente = {}                    # groupe → liste de (message, future)
+        self._minuteries = {}                    # groupe → minuterie du délai de lot
+
+    async def soumettre(self, algorithme, operation, cle, message):
+        """
+        Ajoute une requête à son lot et attend son résultat (lève ValueError en cas d'erreur).
+        """
+        if algorithme not in ALGORITHMES or operation not in OPERATIONS:
+            raise ValueError("Algorithme ou opération inconnu.")
+        boucle = asyncio.get_running_loop()
+        groupe = (algorithme, operation, json.dumps(cle, sort_keys=True))
+        future = boucle.create_future()
+        lot = self._en_attente.setdefault(groupe, [])
+        lot.append((message, future))
+        if len(lot) >= self.taille_lot_max:
+            self._vider(groupe, cle)
+        elif len(lot) == 1:
+            self._minuteries[groupe] = boucle.call_later(self.delai_lot, self._vider, groupe, cle)
+        return await future
+
+    def _vider(self, groupe, cle):
+        minuterie = self._minuteries.pop(groupe, None)
+        if minuterie is not None:
+            minuterie.cancel()
+        lot = self._en_attente.pop(groupe, None)
+        if lot:
+            asyncio.ensure_future(self._executer(groupe, cle, lot))
+
+    async def _executer(self, groupe, cle, lot):
+        algorithme, operation, _ = groupe
+        executeur = self._executeur_processus if algorithme == "rsa" else self._executeur_fils
+        boucle = asyncio.get_running_loop()
+        try:
+            resultats = await boucle.run_in_executor(
+                executeur, traiter_lot, algorithme, operation, cle, [message for message, _ in lot]
+            )
+        except Exception as erreur:                  # Clé invalide, etc. → tout le lot échoue
+            resultats = [(False, str(erreur))] * len(lot)
+        for (_, future), (reussi, valeur) in zip(lot, resultats):
+            if future.done():                        # Client parti entre-temps
+                continue
+            if reussi:
+                future.set_result(valeur)
+            else:
+                future.set_exception(ValueError(valeur))
+
+    def fermer(self):
+        self._executeur_fils.shutdown()
+        self._executeur_processus.shutdown()
+
+
+# ====================== SERVEUR ======================
+class Serveur:
+    """
+    Serveur TCP asyncio. `max_en_cours` limite les requêtes traitées en même temps :
+    quand la limite est atteinte, le serveur arrête de lire les sockets (contre-pression TCP).
+    """
+
+    def __init__(self, ordonnanceur, max_en_cours=MAX_EN_COURS):
+        self.ordonnanceur = ordonnanceur
+        self._places = asyncio.Semaphore(max_en_cours)
+
+    async def _repondre(self, ligne, writer, verrou):
+        identifiant = None
+        try:
+            try:
+                requete = json.loads(ligne)
+                identifiant = requete.get("id")
+                resultat = await self.ordonnanceur.soumettre(
+                    requete["algorithme"], requete["operation"], requete["cle"], requete["message"]
+                )
+                reponse = {"id": identifiant, "resultat": resultat}
+            except (ValueError, KeyError, TypeError, AttributeError) as erreur:
+                reponse = {"id": identifiant, "erreur": str(erreur) or type(erreur).__name__}
+            async with verrou:                       # Une seule réponse écrite à la fois sur la socket
+                writer.write(json.dumps(reponse, ensure_ascii=False).encode('utf-8') + b"\n")
+                await writer.drain()                 # Client lent → on attend (contre-pression)
+        except ConnectionError:
+            pass
+        finally:
+            self._places.release()
+
+    async def servir_client(self, reader, writer):
+        verrou = asyncio.Lock()
+        taches = set()
+        try:
+            while True:
+                try:
+                    ligne = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b'{"id": null, "erreur": "Requete trop longue."}\n')
+                    break
+                if not ligne:
+                    break
+                await self._places.acquire()         # Trop de requêtes en cours → on ne lit plus
+                tache = asyncio.create_task(self._repondre(ligne, writer, verrou))
+                taches.add(tache)
+                tache.add_done_callback(taches.discard)
+            if taches:
+                await asyncio.gather(*taches)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def demarrer(self, hote, port):
+        serveur = await asyncio.start_server(self.servir_client, hote, port, limit=TAILLE_LIGNE_MAX)
+        print(f"Service de chiffrement à l'écoute sur {hote}:{port}", flush=True)
+        async with serveur:
+            await serveur.serve_forever()
+
+
+# ====================== CLIENT DE CHARGE ======================
+async def _client_charge(hote, port, requetes, fenetre, fabriquer, latences):
+    reader, writer = await asyncio.open_connection(hote, port, limit=TAILLE_LIGNE_MAX)
+    departs = {}
+    fenetre_libre = asyncio.Semaphore(fenetre)       # Requêtes envoyées sans réponse au maximum
+    erreurs = 0
+
+    async def lire():
+        nonlocal erreurs
+        for _ in range(len(requetes)):
+            reponse = json.loads(await reader.readline())
+            latences.append(time.perf_counter() - departs.pop(reponse["id"]))
+            if "erreur" in reponse:
+                erreurs += 1
+            fenetre_libre.release()
+
+    lecteur = asyncio.create_task(lire())
+    for identifiant in requetes:
+        await fenetre_libre.acquire()
+        departs[identifiant] = time.perf_counter()
+        writer.write(json.dumps(fabriquer(identifiant)).encode('utf-8') + b"\n")
+        await writer.drain()
+    await lecteur
+    writer.close()
+    return erreurs
+
+
+async def charger(hote, port, connexions, nb_requetes, fenetre, algorithme, taille_message, id_cle=None):
+    """
+    Envoie nb_requetes requêtes réparties sur plusieurs connexions et affiche débit et latences.
+    """
+    message = ("Bonjour le monde ! " * (taille_message // 19 + 1))[:taille_message]
+    if algorithme == "cesar":
+        cle = 3
+    elif algorithme == "vigenere":
+        cle = "LEMON"
+    elif algorithme == "rsa":
+        cle_publique, _ = rsa.rsa_generer_cles_auto(1024)
+        cle = {"e": cle_publique[0], "n": cle_publique[1]}
+    else:
+        if id_cle is None:
+            raise ValueError("rsa-oaep demande --id-cle (clé présente dans le dossier du serveur).")
+        cle = id_cle
+
+    def fabriquer(identifiant):
+        return {"id": identifiant, "algorithme": algorithme, "operation": "chiffrer", "cle": cle, "message": message}
+
+    repartition = [range(i, nb_requetes, connexions) for i in range(connexions)]
+    latences = []
+    debut = time.perf_counter()
+    erreurs = await asyncio.gather(*(_client_charge(hote, port, r, fenetre, fabriquer, latences)
+                                     for r in repartition))
+    duree = time.perf_counter() - debut
+
+    latences.sort()
+    def percentile(p):
+        return latences[min(len(latences) - 1, int(p / 100 * len(latences)))] * 1000
+
+    print(f"{nb_requetes} requêtes {algorithme} en {duree:.2f} s → {nb_requetes / duree:.0f} requêtes/s"
+          f" ({sum(erreurs)} erreur(s))")
+    print(f"Latence : p50 {percentile(50):.2f} ms, p90 {percentile(90):.2f} ms, p99 {percentile(99):.2f} ms")
+
+
+def main(arguments=None):
+    global _cache_oaep
+    analyseur = argparse.ArgumentParser(description="Service de chiffrement asyncio")
+    sous_commandes = analyseur.add_subparsers(dest="commande", required=True)
+
+    p_servir = sous_commandes.add_parser("servir", help="Démarrer le service")
+    p_servir.add_argument("--hote", default="127.0.0.1")
+    p_servir.add_argument("--port", type=int, default=8765)
+    p_servir.add_argument("--max-en-cours", type=int, default=MAX_EN_COURS)
+    p_servir.add_argument("--delai-lot", type=float, default=DELAI_LOT)
+    p_servir.add_argument("--taille-lot", type=int, default=TAILLE_LOT_MAX)
+    p_servir.add_argument("--processus", type=int, default=None, help="Processus pour le RSA fait main")
+    p_servir.add_argument("--fils", type=int, default=None, help="Fils pour les autres algorithmes")
+    p_servir.add_argument("--dossier-cles-oaep", help="Dossier CacheCles des clés RSA OAEP")
+
+    p_charger = sous_commandes.add_parser("charger", help="Test de charge contre un service local")
+    p_charger.add_argument("--hote", default="127.0.0.1")
+    p_charger.add_argument("--port", type=int, default=8765)
+    p_charger.add_argument("--connexions", type=int, default=10)
+    p_charger.add_argument("--requetes", type=int, default=10000)
+    p_charger.add_argument("--fenetre", type=int, default=64, help="Requêtes sans réponse par connexion")
+    p_charger.add_argument("--algorithme", choices=ALGORITHMES, default="cesar")
+    p_charger.add_argument("--taille-message", type=int, default=64)
+    p_charger.add_argument("--id-cle", help="Identifiant de clé pour rsa-oaep")
+
+    args = analyseur.parse_args(arguments)
+
+    if args.commande == "charger":
+        asyncio.run(charger(args.hote, args.port, args.connexions, args.requetes, args.fenetre,
+                            args.algorithme, args.taille_message, args.id_cle))
+        return 0
+
+    if args.dossier_cles_oaep:
+        _cache_oaep = registre.charger_rsa_auto().CacheCles(args.dossier_cles_oaep)
+    ordonnanceur = Ordonnanceur(args.processus, args.fils, args.delai_lot, args.taille_lot)
+    try:
+        asyncio.run(Serveur(ordonnanceur, args.max_en_cours).demarrer(args.hote, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ordonnanceur.fermer()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+# Tests du mode ligne de commande de main.py : une entrée invalide donne un message d'erreur, pas une trace
+import os
+import subprocess
+import sys
+
+import pytest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def lancer(*arguments, entree=None):
+    return subprocess.run([sys.executable, os.path.join(RACINE, "main.py"), *arguments],
+                          input=entree, capture_output=True)
+
+
+def verifier_erreur(resultat):
+    assert resultat.returncode != 0
+    assert b"Traceback" not in resultat.stderr
+    assert resultat.stderr.startswith("Erreur".encode())
+
+
+@pytest.mark.parametrize("algorithme, bits, extension", [("rsa", "512", "json"), ("rsa-oaep", "2048", "pem")])
+def test_dechiffrement_d_une_entree_corrompue(tmp_path, algorithme, bits, extension):
+    cles = {}
+    for nom in ("a", "b"):
+        cles[nom] = (tmp_path / f"{nom}_pub.{extension}", tmp_path / f"{nom}_priv.{extension}")
+        assert lancer(algorithme, "--generer", "--bits", bits, "--cle-publique", str(cles[nom][0]),
+                      "--cle-privee", str(cles[nom][1])).returncode == 0
+    chiffre = lancer(algorithme, "-c", "--cle-publique", str(cles["a"][0]), entree=b"Bonjour le monde" * 50)
+    assert chiffre.returncode == 0
+    donnees = chiffre.stdout
+
+    modifie = donnees[:-1] + bytes([donnees[-1] ^ 1])
+    for entree, cle_privee in ((modifie, cles["a"][1]), (donnees[:-7], cles["a"][1]), (donnees, cles["b"][1])):
+        verifier_erreur(lancer(algorithme, "-d", "--cle-privee", str(cle_privee), entree=entree))
+    assert lancer(algorithme, "-d", "--cle-privee", str(cles["a"][1]), entree=donnees).stdout == \
+        b"Bonjour le monde" * 50
@@ -0,0 +1,36 @@
+# Tests de rsa.py (format binaire des messages chiffrés)
+import io
+import os
+
+import pytest
+
+import rsa
+
+
+@pytest.fixture(scope="module")
+def cles():
+    return rsa.rsa_generer_cles_auto(512)
+
+
+def test_aller_retour(cles):
+    cle_publique, cle_privee = cles
+    message = os.urandom(1000)
+    assert rsa.rsa_dechiffrer_binaire(rsa.rsa_chiffrer_binaire(message, cle_publique), cle_privee) == message
+
+
+def test_mauvaise_cle_de_meme_taille(cles):
+    cle_publique, _ = cles
+    _, autre_cle_privee = rsa.rsa_generer_cles_auto(512)
+    donnees = rsa.rsa_chiffrer_binaire(os.urandom(1000), cle_publique)
+    with pytest.raises(ValueError):
+        rsa.rsa_dechiffrer_binaire(donnees, autre_cle_privee)
+    with pytest.raises(ValueError):
+        rsa.rsa_dechiffrer_flux(io.BytesIO(donnees), io.BytesIO(), autre_cle_privee)
+
+
+@pytest.mark.parametrize("modifier", [lambda d: d[:-1], lambda d: d + bytes(64), lambda d: d[:10]])
+def test_message_tronque_ou_trop_long(cles, modifier):
+    cle_publique, cle_privee = cles
+    donnees = rsa.rsa_chiffrer_binaire(b"Bonjour le monde" * 20, cle_publique)
+    with pytest.raises(ValueError):
+        rsa.rsa_dechiffrer_binaire(modifier(donnees), cle_privee)
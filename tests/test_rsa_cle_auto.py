@@ -0,0 +1,75 @@
+# Tests de "rsa cle auto.py" (RSA OAEP, mode hybride, cache et réserve de clés)
+import pytest
+
+import registre
+
+rsa_auto = registre.charger_rsa_auto()
+
+
+@pytest.fixture(scope="module")
+def paire():
+    return rsa_auto.rsa_generer_cles(2048)
+
+
+def test_cache_refuse_un_identifiant_qui_sort_du_dossier(tmp_path, paire):
+    cle_privee, _ = paire
+    id_cle = rsa_auto.CacheCles(tmp_path / "ailleurs").enregistrer(cle_privee)
+    cache = rsa_auto.CacheCles(tmp_path / "cles")
+    for id_invalide in ("../ailleurs/" + id_cle, id_cle.upper(), "", None):
+        with pytest.raises(ValueError):
+            cache.charger(id_invalide)
+    with pytest.raises(ValueError):
+        cache.charger("0" * 64)                     # Identifiant bien formé, mais clé absente
+    assert rsa_auto.CacheCles(tmp_path / "ailleurs").charger(id_cle)[1].public_numbers() == \
+        cle_privee.public_key().public_numbers()
+
+
+def test_reserve_refuse_une_taille_de_cle_trop_petite():
+    with pytest.raises(ValueError):
+        rsa_auto.ReserveCles(taille_cle=100)
+
+
+def test_reserve_se_remplit_avec_seuil_bas_nul():
+    reserve = rsa_auto.ReserveCles(taille=2, seuil_bas=0, taille_cle=1024)
+    try:
+        for _ in range(5):
+            reserve.prendre(timeout=30)
+    finally:
+        reserve.fermer()
+
+
+def test_reserve_releve_l_erreur_de_generation(monkeypatch):
+    def echec(taille_cle):
+        raise RuntimeError("génération impossible")
+
+    monkeypatch.setattr(rsa_auto, "rsa_generer_cles", echec)
+    reserve = rsa_auto.ReserveCles(taille=2, seuil_bas=0, taille_cle=1024)
+    try:
+        with pytest.raises(RuntimeError, match="génération impossible"):
+            reserve.prendre()                       # Sans timeout : ne doit pas bloquer
+    finally:
+        reserve.fermer()
+
+
+@pytest.mark.parametrize("modifier", [
+    lambda d: d[:100] + bytes([d[100] ^ 1]) + d[101:],     # Un octet de la clé de session modifié
+    lambda d: d[:-1] + bytes([d[-1] ^ 1]),                 # Un octet du tag du dernier morceau modifié
+    lambda d: d[:len(d) // 2] + bytes([d[len(d) // 2] ^ 1]) + d[len(d) // 2 + 1:],   # Morceau du milieu
+    lambda d: d[:-20],                                     # Fin coupée
+    lambda d: d[:5],                                       # En-tête incomplet
+])
+def test_hybride_modifie_ou_tronque(paire, modifier):
+    cle_privee, cle_publique = paire
+    donnees = rsa_auto.rsa_chiffrer_hybride(b"Bonjour le monde" * 10000, cle_publique)
+    assert rsa_auto.rsa_dechiffrer_hybride(donnees, cle_privee) == b"Bonjour le monde" * 10000
+    with pytest.raises(ValueError):
+        rsa_auto.rsa_dechiffrer_hybride(modifier(donnees), cle_privee)
+
+
+def test_hybride_longueur_de_morceau_demesuree(paire):
+    cle_privee, cle_publique = paire
+    donnees = bytearray(rsa_auto.rsa_chiffrer_hybride(b"x", cle_publique))
+    debut_morceau = rsa_auto._ENTETE_HYBRIDE.size + cle_privee.key_size // 8 + 8
+    donnees[debut_morceau:debut_morceau + 4] = (0xFFFFFFFF).to_bytes(4, 'big')
+    with pytest.raises(ValueError, match="trop grand"):
+        rsa_auto.rsa_dechiffrer_hybride(bytes(donnees), cle_privee)
@@ -1,72 +1,402 @@
 # vigenere.py
-def vigenere_chiffrer(message, cle):
+import functools
+import itertools
+import mmap                                    # Pour traiter les gros fichiers sans les charger en mémoire
+import os
+
+from alphabets import ALPHABET_ASCII, alphabet_valide
+
+np = None                                      # NumPy (optionnel), importé au premier gros message
+_numpy_essaye = False                          # Import de NumPy déjà tenté ?
+
+TAILLE_BLOC_FICHIER = 1 << 20                  # Taille des morceaux lus dans un fichier (1 Mo)
+SEUIL_NUMPY = 64 * 1024                        # En dessous, la boucle Python est plus rapide (pas de coût de conversion)
+TAILLE_CACHE_CLES = 256                        # Nombre de clés compilées gardées en cache (LRU)
+SEUIL_PARALLELE_FICHIER = 8 << 20              # En dessous, démarrer des processus coûte plus que le chiffrement
+TAILLE_MORCEAU_PARALLELE = 16 << 20            # Part d'un fichier confiée à un processus en une fois (16 Mo)
+
+
+# ====================== OUTILS INTERNES ======================
+def _decalages(cle):
     """
-    Chiffre un message avec l'algorithme de Vigénère.
+    Décalages de la clé : un pour les minuscules, un pour les majuscules.
     
     """
-    #Chaque lettre du message est décalée selon la lettre correspondante de la clé (répétée). Les caractères non alphabétiques (espaces, ponctuation) sont conservés tels quels.
+    decalages_min = [ord(c.lower()) - ord('a') for c in cle]
+    decalages_maj = [ord(c.upper()) - ord('A') for c in cle]
+    return decalages_min, decalages_maj
+
+
+def _numpy_disponible():
+    """
+    Importe NumPy au premier besoin seulement : son import coûte ~100 ms,
+    inutile pour les petits messages (et pour le démarrage du programme).
+    
+    """
+    global np, _numpy_essaye
+    if not _numpy_essaye:
+        _numpy_essaye = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None                          # Sans NumPy → on garde la boucle Python pure
+    return np is not None
+
+
+def _vigenere_numpy(codes, est_lettre, sorties, cle_longueur, cle_index):
+    """
+    Version vectorisée (NumPy) : tout le morceau est traité en quelques opérations de tableau.
+    codes : tableau d'octets (uint8) ou de points de code Unicode (uint32).
+    est_lettre : masque des codes qui sont des lettres ; sorties : table (position dans la clé × code) aplatie,
+    voir VigenereCompile._tableaux_numpy().
+    Retourne (tableau transformé, nouvel indice dans la clé).
+    
+    """
+    largeur = len(est_lettre)
+    codes_table = codes
+    if codes.dtype != np.uint8:
+        # Codes au-delà de la table : jamais des lettres (la dernière case de la table n'en est pas une)
+        codes_table = np.minimum(codes, largeur - 1)
+    lettres = est_lettre[codes_table]
+
+    # Position dans la clé de chaque code = nombre de lettres AVANT lui (+ cle_index de départ).
+    # C'est la règle "seules les lettres font avancer la clé", calculée d'un coup par une somme cumulée.
+    type_entier = np.int32 if len(codes) + cle_longueur * largeur < 2 ** 31 else np.int64
+    positions = np.cumsum(lettres, dtype=type_entier)
+    positions += cle_index % cle_longueur - 1
+    positions %= cle_longueur
+
+    # Une seule lecture de table par code : sorties[position, code] (les non-lettres y sont inchangées)
+    positions *= largeur
+    positions += codes_table
+    resultat = sorties.take(positions)
+    if codes_table is not codes:
+        resultat = np.where(lettres, resultat, codes)
+    return resultat, cle_index + int(np.count_nonzero(lettres))
 
-    resultat = ""                              # Chaîne qui va contenir le message chiffré final
-    cle_index = 0                              # Indice dans la clé (on avance seulement sur les lettres)
-    cle_longueur = len(cle)                    # Longueur de la clé (pour faire % plus tard)
-
-    for char in message:                       # On parcourt chaque caractère du message
-        if 'a' <= char <= 'z':                 # Si c'est une lettre minuscule
-            # On prend la lettre courante de la clé (répétée avec % cle_longueur)
-            # .lower() pour être sûr d'avoir une minuscule
-            decalage = ord(cle[cle_index % cle_longueur].lower()) - ord('a')
-            # On applique le décalage de César avec cette lettre de clé
-            # ord(char) - ord('a') → position 0-25
-            # + decalage → on décale
-            # % 26 → on boucle dans l'alphabet
-            # + ord('a') → on revient à la lettre
-            resultat += chr(((ord(char) - ord('a') + decalage) % 26) + ord('a'))
-            cle_index += 1                     # On avance dans la clé (seulement pour les lettres !)
-
-        elif 'A' <= char <= 'Z':               # Si c'est une lettre majuscule
-            # Même principe mais avec les majuscules
-            decalage = ord(cle[cle_index % cle_longueur].upper()) - ord('A')
-            resultat += chr(((ord(char) - ord('A') + decalage) % 26) + ord('A'))
-            cle_index += 1                     # On avance dans la clé
 
+class VigenereCompile:
+    """
+    Clé Vigénère "compilée" pour un alphabet : les décalages de la clé et les tables de substitution
+    de chaque position de la clé sont calculés à la création.
+    Utiliser vigenere_compiler(cle, alphabet), qui garde les clés compilées en cache.
+    
+    """
+
+    def __init__(self, cle, alphabet=None):
+        if not cle:
+            raise ValueError("La clé ne peut pas être vide !")
+        alphabet = alphabet_valide(alphabet)
+        self.cle = cle
+        self.alphabet = alphabet
+
+        if alphabet == ALPHABET_ASCII:
+            decalages = _decalages(cle)        # Formules d'origine (même résultat pour tous les caractères de clé)
         else:
-            # Si c'est un espace, un chiffre, un "!", un "-", etc. → on ne touche pas
-            # Et surtout : on N'AVANCE PAS dans la clé !
-            resultat += char
+            decalages = [[alphabet.decalage(c) for c in cle]] * len(alphabet.groupes)
+        self.decalages = tuple(tuple(d) for d in decalages)        # [groupe][position dans la clé]
+
+        # Tables de chaque position de la clé, pour chiffrer (signe 1) et pour déchiffrer (signe -1).
+        # Deux positions avec le même décalage partagent la même table.
+        self._tables_str = {}
+        self._tables_octets = {}
+        for signe in (1, -1):
+            partagees_str, partagees_octets = {}, {}
+            tables_str, tables_octets = [], []
+            for position in range(len(cle)):
+                decalage = tuple(signe * d[position] for d in self.decalages)
+                if decalage not in partagees_str:
+                    partagees_str[decalage] = alphabet.correspondance(decalage)
+                    if alphabet.octets_possible:
+                        partagees_octets[decalage] = alphabet.table_octets(decalage)
+                tables_str.append(partagees_str[decalage])
+                if alphabet.octets_possible:
+                    tables_octets.append(partagees_octets[decalage])
+            self._tables_str[signe] = tables_str
+            self._tables_octets[signe] = tables_octets
+        # 1 pour chaque octet qui est une lettre de l'alphabet
+        self._est_lettre_octet = bytes(1 if chr(o) in alphabet.rangs else 0 for o in range(256))
+        self._non_lettres_octet = bytes(o for o in range(256) if not self._est_lettre_octet[o])
+        self._numpy = {}                       # Tables NumPy, préparées au premier gros message
+
+    def __repr__(self):
+        return f"VigenereCompile({self.cle!r}, {self.alphabet!r})"
+
+    def _tableaux_numpy(self, signe, binaire):
+        """
+        (est_lettre, sorties) pour _vigenere_numpy : sur les 256 octets en binaire,
+        sur les points de code 0 à max(alphabet) pour du texte.
+        
+        """
+        if (signe, binaire) not in self._numpy:
+            if binaire:
+                est_lettre = np.frombuffer(self._est_lettre_octet, dtype=np.uint8).astype(bool)
+                sorties = np.frombuffer(b"".join(self._tables_octets[signe]), dtype=np.uint8)
+            else:
+                largeur = max(map(ord, self.alphabet.rangs)) + 2          # + une case "non-lettre" à la fin
+                est_lettre = np.zeros(largeur, dtype=bool)
+                est_lettre[[ord(lettre) for lettre in self.alphabet.rangs]] = True
+                sorties = np.tile(np.arange(largeur, dtype=np.uint32), (len(self.cle), 1))
+                for position, table in enumerate(self._tables_str[signe]):
+                    for source, cible in table.items():
+                        sorties[position, ord(source)] = ord(cible)
+                sorties = sorties.ravel()
+            self._numpy[(signe, binaire)] = (est_lettre, sorties)
+        return self._numpy[(signe, binaire)]
+
+    def traiter(self, morceau, cle_index=0, signe=1):
+        """
+        Chiffre (signe = 1) ou déchiffre (signe = -1) un morceau de message.
+        Retourne (morceau transformé, nouvel indice dans la clé).
+        Le morceau peut être du texte (str) ou du binaire (bytes, bytearray, memoryview) :
+        en binaire, seuls les octets de l'alphabet sont modifiés, donc avec l'alphabet par défaut
+        un texte UTF-8 peut être coupé n'importe où sans changer le résultat.
+        
+        """
+        binaire = not isinstance(morceau, str)
+        if binaire:
+            alphabet_valide(self.alphabet, binaire=True)
 
+        # Gros morceau + NumPy disponible → noyau vectorisé (choix automatique selon la taille)
+        if len(morceau) >= SEUIL_NUMPY and self.alphabet.numpy_possible and _numpy_disponible():
+            cle_longueur = len(self.cle)
+            if binaire:
+                resultat, cle_index = _vigenere_numpy(np.frombuffer(morceau, dtype=np.uint8),
+                                                      *self._tableaux_numpy(signe, True), cle_longueur, cle_index)
+                resultat = resultat.tobytes()
+                if isinstance(morceau, bytearray):
+                    return bytearray(resultat), cle_index
+                return resultat, cle_index
+            try:
+                if self.alphabet.ascii:
+                    # Les octets UTF-8 non ASCII ne sont jamais des lettres d'un alphabet ASCII : résultat identique
+                    codes = np.frombuffer(morceau.encode('utf-8'), dtype=np.uint8)
+                    resultat, cle_index = _vigenere_numpy(codes, *self._tableaux_numpy(signe, True),
+                                                          cle_longueur, cle_index)
+                    return resultat.tobytes().decode('utf-8'), cle_index
+                # Alphabet non ASCII (accents...) : on travaille sur les points de code (UTF-32)
+                codes = np.frombuffer(morceau.encode('utf-32-le'), dtype=np.uint32)
+                resultat, cle_index = _vigenere_numpy(codes, *self._tableaux_numpy(signe, False),
+                                                      cle_longueur, cle_index)
+                return resultat.tobytes().decode('utf-32-le'), cle_index
+            except UnicodeEncodeError:
+                pass                           # Caractère non encodable → on repasse par la boucle Python
+
+        cle_longueur = len(self.cle)
+        position = cle_index % cle_longueur
+        if not binaire:
+            tables = self._tables_str[signe]
+            resultat = []                      # Liste + join à la fin → coût linéaire
+            for char in morceau:
+                remplacant = tables[position].get(char)
+                if remplacant is None:
+                    resultat.append(char)      # Non-lettre → recopiée, la clé n'avance PAS
+                else:
+                    resultat.append(remplacant)
+                    position += 1              # On avance dans la clé (seulement pour les lettres !)
+                    cle_index += 1
+                    if position == cle_longueur:
+                        position = 0
+            return "".join(resultat), cle_index
+
+        # Binaire : on modifie une copie octet par octet
+        tables = self._tables_octets[signe]
+        est_lettre = self._est_lettre_octet
+        resultat = bytearray(morceau)
+        for i, octet in enumerate(resultat):
+            if est_lettre[octet]:
+                resultat[i] = tables[position][octet]
+                position += 1
+                cle_index += 1
+                if position == cle_longueur:
+                    position = 0
+        if isinstance(morceau, bytearray):
+            return resultat, cle_index
+        return bytes(resultat), cle_index
+
+    def compter_lettres(self, morceau):
+        """
+        Nombre d'octets du morceau (binaire) qui sont des lettres, c'est-à-dire de combien il fait avancer la clé.
+        
+        """
+        return len(bytes(morceau).translate(None, self._non_lettres_octet))   # Non-lettres supprimées (en C)
+
+    def chiffrer(self, message):
+        return self.traiter(message, 0, 1)[0]
+
+    def dechiffrer(self, message):
+        return self.traiter(message, 0, -1)[0]
+
+
+@functools.lru_cache(maxsize=TAILLE_CACHE_CLES)
+def vigenere_compiler(cle, alphabet=None):
+    """
+    Retourne la clé compilée (VigenereCompile) pour (cle, alphabet).
+    Les dernières clés utilisées restent en cache (LRU).
+    
+    """
+    return VigenereCompile(cle, alphabet)
+
+
+def vigenere_chiffrer(message, cle, alphabet=None):
+    """
+    Chiffre un message avec l'algorithme de Vigénère.
+    alphabet : alphabets.Alphabet personnalisé (par défaut a-z / A-Z).
+    
+    """
+    #Chaque lettre du message est décalée selon la lettre correspondante de la clé (répétée). Les caractères non alphabétiques (espaces, ponctuation) sont conservés tels quels.
+
+    resultat, _ = vigenere_compiler(cle, alphabet).traiter(message, 0, 1)
     return resultat                            # On retourne le message chiffré complet
 
 
-def vigenere_dechiffrer(message, cle):
+def vigenere_dechiffrer(message, cle, alphabet=None):
     """
     Déchiffre un message chiffré avec l'algorithme de Vigénère.
     
     """
     #On fait exactement l'inverse : on soustrait le décalage au lieu de l'ajouter.
 
-    resultat = ""                              # Chaîne qui contiendra le message déchiffré
-    cle_index = 0                              # Indice courant dans la clé
-    cle_longueur = len(cle)                    # Longueur de la clé (utile pour le modulo)
+    resultat, _ = vigenere_compiler(cle, alphabet).traiter(message, 0, -1)
+    return resultat                            # Message clair retrouvé
 
-    for char in message:                       # On parcourt chaque caractère du message chiffré
-        if 'a' <= char <= 'z':                 # Lettre minuscule chiffrée
-            decalage = ord(cle[cle_index % cle_longueur].lower()) - ord('a')
-            # Pour déchiffrer : on SOUSTRAIT le décalage au lieu d'ajouter
-            # +26 pour éviter les nombres négatifs avant le modulo
-            resultat += chr(((ord(char) - ord('a') - decalage + 26) % 26) + ord('a'))
-            cle_index += 1                     # On avance dans la clé
 
-        elif 'A' <= char <= 'Z':               # Lettre majuscule chiffrée
-            decalage = ord(cle[cle_index % cle_longueur].upper()) - ord('A')
-            resultat += chr(((ord(char) - ord('A') - decalage + 26) % 26) + ord('A'))
-            cle_index += 1
+# ====================== CHIFFREMENT EN FLUX (morceau par morceau) ======================
+class VigenereFlux:
+    """
+    Chiffreur/déchiffreur Vigénère qui reçoit le message par morceaux.
+    La position dans la clé (cle_index) est conservée d'un morceau à l'autre :
+    chiffrer "Attack " puis "at dawn" donne la même chose que chiffrer "Attack at dawn".
+    
+    """
 
-        else:
-            # Caractères non alphabétiques → on les recopie tels quels
-            # Et on ne touche PAS à cle_index
-            resultat += char
+    def __init__(self, cle, dechiffrer=False, cle_index=0, alphabet=None):
+        self.cle = cle
+        self.dechiffrer = dechiffrer
+        self.cle_index = cle_index             # Nombre de lettres déjà traitées
+        self._signe = -1 if dechiffrer else 1
+        self._compile = vigenere_compiler(cle, alphabet)
 
-    return resultat                            # Message clair retrouvé
+    def traiter(self, morceau):
+        """
+        Transforme un morceau (str ou bytes) et met à jour la position dans la clé.
+        
+        """
+        resultat, self.cle_index = self._compile.traiter(morceau, self.cle_index, self._signe)
+        return resultat
+
+    def traiter_iterable(self, morceaux):
+        """
+        Générateur : transforme chaque morceau d'un itérable (liste, fichier, ...) au fur et à mesure.
+        
+        """
+        for morceau in morceaux:
+            yield self.traiter(morceau)
+
+    def traiter_fichier(self, entree, sortie, taille_bloc=TAILLE_BLOC_FICHIER):
+        """
+        Lit le fichier ouvert `entree` par blocs et écrit le résultat dans `sortie`.
+        Mémoire constante quelle que soit la taille du fichier. Retourne le nombre d'octets/caractères traités.
+        
+        """
+        total = 0
+        while True:
+            morceau = entree.read(taille_bloc)
+            if not morceau:
+                break
+            sortie.write(self.traiter(morceau))
+            total += len(morceau)
+        return total
+
+
+def vigenere_fichier(chemin_entree, chemin_sortie, cle, dechiffrer=False,
+                     utiliser_mmap=True, taille_bloc=TAILLE_BLOC_FICHIER, alphabet=None, processus=1):
+    """
+    Chiffre (ou déchiffre) un fichier complet vers un autre fichier, en mémoire constante.
+    Avec utiliser_mmap=True, les deux fichiers sont projetés en mémoire (mmap) et traités par blocs,
+    ce qui évite les copies de lecture/écriture sur les très gros fichiers.
+    processus > 1 (ou None = tous les cœurs) : gros fichiers découpés et traités en parallèle
+    (voir _vigenere_fichier_parallele), avec exactement le même résultat ; demande utiliser_mmap=True.
+    Retourne le nombre d'octets traités.
+    
+    """
+    if processus != 1 and not utiliser_mmap:
+        raise ValueError("Le mode parallèle écrit dans la sortie projetée en mémoire : il demande utiliser_mmap=True.")
+    flux = VigenereFlux(cle, dechiffrer, alphabet=alphabet)
+    taille = os.path.getsize(chemin_entree)
+
+    if not utiliser_mmap or taille == 0:       # mmap refuse les fichiers vides
+        with open(chemin_entree, 'rb') as entree, open(chemin_sortie, 'wb') as sortie:
+            return flux.traiter_fichier(entree, sortie, taille_bloc)
+
+    processus = processus or os.cpu_count() or 1
+    if processus > 1 and taille >= SEUIL_PARALLELE_FICHIER:
+        return _vigenere_fichier_parallele(chemin_entree, chemin_sortie, cle, flux._signe, alphabet,
+                                           taille, processus, taille_bloc)
+
+    with open(chemin_entree, 'rb') as entree, open(chemin_sortie, 'w+b') as sortie:
+        sortie.truncate(taille)                # Le fichier de sortie a la même taille que l'entrée
+        with mmap.mmap(entree.fileno(), 0, access=mmap.ACCESS_READ) as source, \
+                mmap.mmap(sortie.fileno(), taille) as destination:
+            for debut in range(0, taille, taille_bloc):
+                fin = min(debut + taille_bloc, taille)
+                destination[debut:fin] = flux.traiter(source[debut:fin])
+    return taille
+
+
+# ====================== FICHIERS EN PARALLÈLE ======================
+def _compter_lettres_fichier(chemin, debut, fin, cle, alphabet, taille_bloc):
+    # Exécuté dans un processus : nombre de lettres entre les octets debut et fin du fichier
+    compile = vigenere_compiler(cle, alphabet)
+    total = 0
+    with open(chemin, 'rb') as entree, mmap.mmap(entree.fileno(), 0, access=mmap.ACCESS_READ) as source:
+        for position in range(debut, fin, taille_bloc):
+            total += compile.compter_lettres(source[position:min(position + taille_bloc, fin)])
+    return total
+
+
+def _traiter_morceau_fichier(chemin_entree, chemin_sortie, debut, fin, cle, signe, alphabet, cle_index, taille_bloc):
+    # Exécuté dans un processus : transforme les octets debut à fin en partant de cle_index,
+    # et les écrit directement dans le fichier de sortie projeté en mémoire (chaque processus a sa zone)
+    compile = vigenere_compiler(cle, alphabet)
+    with open(chemin_entree, 'rb') as entree, open(chemin_sortie, 'r+b') as sortie, \
+            mmap.mmap(entree.fileno(), 0, access=mmap.ACCESS_READ) as source, \
+            mmap.mmap(sortie.fileno(), 0) as destination:
+        for position in range(debut, fin, taille_bloc):
+            fin_bloc = min(position + taille_bloc, fin)
+            resultat, cle_index = compile.traiter(source[position:fin_bloc], cle_index, signe)
+            destination[position:fin_bloc] = resultat
+
+
+def _vigenere_fichier_parallele(chemin_entree, chemin_sortie, cle, signe, alphabet, taille, processus, taille_bloc):
+    """
+    Vigénère sur un gros fichier avec plusieurs processus. On ne peut pas couper le fichier n'importe où
+    et chiffrer chaque morceau depuis le début de la clé : seules les lettres font avancer la clé.
+    1. chaque processus compte les lettres de ses morceaux ;
+    2. une somme préfixe de ces comptes donne la position dans la clé au début de chaque morceau ;
+    3. chaque processus chiffre ses morceaux à partir de cette position et écrit dans la sortie (mmap).
+    Le résultat est identique, octet pour octet, au traitement en série.
+    
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    alphabet_valide(alphabet, binaire=True)
+    debuts = range(0, taille, TAILLE_MORCEAU_PARALLELE)
+    fins = [min(debut + TAILLE_MORCEAU_PARALLELE, taille) for debut in debuts]
+    with open(chemin_sortie, 'w+b') as sortie:
+        sortie.truncate(taille)                # Sortie à sa taille finale avant que les processus y écrivent
+
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        comptes = executeur.map(_compter_lettres_fichier, itertools.repeat(chemin_entree), debuts, fins,
+                                itertools.repeat(cle), itertools.repeat(alphabet), itertools.repeat(taille_bloc))
+        departs = itertools.accumulate(comptes, initial=0)      # Lettres avant chaque morceau
+        for _ in executeur.map(_traiter_morceau_fichier, itertools.repeat(chemin_entree),
+                               itertools.repeat(chemin_sortie), debuts, fins, itertools.repeat(cle),
+                               itertools.repeat(signe), itertools.repeat(alphabet), departs,
+                               itertools.repeat(taille_bloc)):
+            pass                               # Rien à récupérer, mais les erreurs des processus remontent ici
+    return taille
 
 
 